@@ -9,17 +9,103 @@ This script simulates the complete GTC order flow:
 """
 
 import json
+import mmap
+import os
+import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 TRADER_DIR = Path(__file__).parent
 STATE_DIR = TRADER_DIR / "polymarket-trader"
 OPEN_ORDERS_FILE = STATE_DIR / "open_orders.json"
+# Plain-string forms for open()/os calls, stringified once
+OPEN_ORDERS_PATH = str(OPEN_ORDERS_FILE)
+OPEN_ORDERS_TMP_PATH = OPEN_ORDERS_PATH + ".tmp"
+
+BANNER = "=" * 70
+
+# Whole report rendered in one write; placeholders come from the test order
+# plus the derived fields built in main()
+REPORT_TEMPLATE = """\
+{banner}
+🧪 GTC ORDER FLOW TEST
+{banner}
+
+This test demonstrates the complete GTC order flow:
+1. Order placement with 30-minute TTL
+2. Order tracking in open_orders.json
+3. Order monitor checks (every 5 minutes)
+4. Three possible outcomes: FILLED, TTL_EXPIRED, or STILL_OPEN
+
+{banner}
+STEP 1: GTC ORDER PLACED
+{banner}
+
+Market: {market}
+Action: BUY {side} @ {price_c:.0f}¢
+Amount: ${amount:.2f}
+Edge: {edge:.1f}%
+Sources: {sources_str}
+
+Order ID: {order_id}
+Time placed: {time_placed}
+TTL expires: {ttl_expiry}
+
+✅ Order tracked in {open_orders_path}
+
+{banner}
+STEP 2: ORDER MONITORING (Every 5 Minutes)
+{banner}
+
+The order_monitor.py script will check this order every 5 minutes:
+
+Scenario A - ORDER FILLED:
+  → Query Polymarket API: order status = 'MATCHED'
+  → Extract fill details (actual price, shares)
+  → Create Position in positions_state.json
+  → Update order status to 'FILLED' in open_orders.json
+  → Log fill to daily journal
+
+Scenario B - TTL EXPIRED (30 minutes):
+  → Current time > ttl_expiry
+  → Cancel order via API: client.cancel(order_id)
+  → Update order status to 'CANCELLED' in open_orders.json
+  → Log cancellation with reason 'TTL_EXPIRED'
+  → Funds freed for next opportunity
+
+Scenario C - STILL OPEN:
+  → Order status = 'LIVE' or 'OPEN'
+  → TTL not yet expired
+  → Continue waiting
+  → Check again in 5 minutes
+
+{banner}
+CURRENT STATUS
+{banner}
+
+Order: {market}
+Status: OPEN
+Time remaining: {minutes_remaining:.0f} minutes
+
+To check order status, run:
+  python3 order_monitor.py
+
+To manually clear test order:
+  rm {open_orders_path} && echo '[]' > {open_orders_path}
+
+{banner}
+"""
 
-def create_test_order():
-    """Create a simulated GTC order for testing."""
+def create_test_order(now=None):
+    """Create a simulated GTC order for testing, placed at `now` (default: current time)."""
 
-    time_placed = datetime.now()
+    time_placed = now or datetime.now()
     ttl_expiry = time_placed + timedelta(minutes=30)
 
     test_order = {
@@ -32,6 +118,7 @@ def create_test_order():
         "amount": 5.0,
         "time_placed": time_placed.isoformat(),
         "ttl_expiry": ttl_expiry.isoformat(),
+        "ttl_expiry_epoch": int(ttl_expiry.timestamp()),
         "status": "OPEN",
         "edge": 18.5,
         "sources": ["noaa", "open-meteo", "visual-crossing"],
@@ -40,102 +127,62 @@ def create_test_order():
 
     return test_order
 
+def load_open_orders():
+    """Load tracked orders, or [] if the file is missing, empty or corrupt."""
+    if not os.path.exists(OPEN_ORDERS_PATH):
+        return []
+
+    try:
+        with open(OPEN_ORDERS_PATH, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Parse straight from the mapping; no intermediate copy with orjson
+            if HAS_ORJSON:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return json.loads(mm[:])
+    except (OSError, ValueError):  # ValueError covers empty files and JSON decode errors
+        return []
+
+def save_open_orders(orders):
+    """Atomically replace open_orders.json (write-then-rename, so order_monitor.py never sees a truncated file)."""
+    if HAS_ORJSON:
+        # Whole document serialized into one buffer in C
+        with open(OPEN_ORDERS_TMP_PATH, 'wb') as f:
+            f.write(orjson.dumps(orders, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        # json.dump streams encoder chunks through the file buffer rather than
+        # building the full pretty-printed string first (as json.dumps does)
+        with open(OPEN_ORDERS_TMP_PATH, 'w') as f:
+            json.dump(orders, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(OPEN_ORDERS_TMP_PATH, OPEN_ORDERS_PATH)
+
 def main():
-    print("="*70)
-    print("🧪 GTC ORDER FLOW TEST")
-    print("="*70)
-    print()
-
-    print("This test demonstrates the complete GTC order flow:")
-    print("1. Order placement with 30-minute TTL")
-    print("2. Order tracking in open_orders.json")
-    print("3. Order monitor checks (every 5 minutes)")
-    print("4. Three possible outcomes: FILLED, TTL_EXPIRED, or STILL_OPEN")
-    print()
+    now = datetime.now()
 
     # Create test order
-    test_order = create_test_order()
-
-    print("="*70)
-    print("STEP 1: GTC ORDER PLACED")
-    print("="*70)
-    print()
-    print(f"Market: {test_order['market']}")
-    print(f"Action: BUY {test_order['side']} @ {test_order['price']*100:.0f}¢")
-    print(f"Amount: ${test_order['amount']:.2f}")
-    print(f"Edge: {test_order['edge']:.1f}%")
-    print(f"Sources: {', '.join(test_order['sources'])}")
-    print()
-    print(f"Order ID: {test_order['order_id']}")
-    print(f"Time placed: {test_order['time_placed']}")
-    print(f"TTL expires: {test_order['ttl_expiry']}")
-    print()
+    test_order = create_test_order(now)
 
     # Save to open_orders.json
-    orders = []
-    if OPEN_ORDERS_FILE.exists():
-        with open(OPEN_ORDERS_FILE, 'r') as f:
-            try:
-                orders = json.load(f)
-            except:
-                orders = []
-
+    orders = load_open_orders()
     orders.append(test_order)
 
-    with open(OPEN_ORDERS_FILE, 'w') as f:
-        json.dump(orders, f, indent=2)
-
-    print(f"✅ Order tracked in {OPEN_ORDERS_FILE}")
-    print()
-
-    # Explain monitoring
-    print("="*70)
-    print("STEP 2: ORDER MONITORING (Every 5 Minutes)")
-    print("="*70)
-    print()
-    print("The order_monitor.py script will check this order every 5 minutes:")
-    print()
-    print("Scenario A - ORDER FILLED:")
-    print("  → Query Polymarket API: order status = 'MATCHED'")
-    print("  → Extract fill details (actual price, shares)")
-    print("  → Create Position in positions_state.json")
-    print("  → Update order status to 'FILLED' in open_orders.json")
-    print("  → Log fill to daily journal")
-    print()
-    print("Scenario B - TTL EXPIRED (30 minutes):")
-    print("  → Current time > ttl_expiry")
-    print("  → Cancel order via API: client.cancel(order_id)")
-    print("  → Update order status to 'CANCELLED' in open_orders.json")
-    print("  → Log cancellation with reason 'TTL_EXPIRED'")
-    print("  → Funds freed for next opportunity")
-    print()
-    print("Scenario C - STILL OPEN:")
-    print("  → Order status = 'LIVE' or 'OPEN'")
-    print("  → TTL not yet expired")
-    print("  → Continue waiting")
-    print("  → Check again in 5 minutes")
-    print()
+    save_open_orders(orders)
 
     # Calculate time remaining
-    ttl_time = datetime.fromisoformat(test_order['ttl_expiry'])
-    now = datetime.now()
-    minutes_remaining = (ttl_time - now).total_seconds() / 60
-
-    print("="*70)
-    print("CURRENT STATUS")
-    print("="*70)
-    print()
-    print(f"Order: {test_order['market']}")
-    print(f"Status: OPEN")
-    print(f"Time remaining: {minutes_remaining:.0f} minutes")
-    print()
-    print("To check order status, run:")
-    print("  python3 order_monitor.py")
-    print()
-    print("To manually clear test order:")
-    print(f"  rm {OPEN_ORDERS_FILE} && echo '[]' > {OPEN_ORDERS_FILE}")
-    print()
-    print("="*70)
+    minutes_remaining = (test_order['ttl_expiry_epoch'] - int(now.timestamp())) / 60
+
+    sys.stdout.write(REPORT_TEMPLATE.format_map({
+        **test_order,
+        'banner': BANNER,
+        'price_c': test_order['price'] * 100,
+        'sources_str': ', '.join(test_order['sources']),
+        'minutes_remaining': minutes_remaining,
+        'open_orders_path': OPEN_ORDERS_PATH,
+    }))
 
 if __name__ == "__main__":
     main()
@@ -15,9 +15,30 @@ import sys
 import json
 import math
 import time
+import heapq
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = HAS_NUMPY
+except ImportError:
+    HAS_NUMBA = False
+
 TRADER_DIR = Path(__file__).parent
 SCRIPTS_DIR = TRADER_DIR / "polymarket-trader" / "scripts"
 sys.path.insert(0, str(SCRIPTS_DIR))
@@ -25,12 +46,14 @@ sys.path.insert(0, str(SCRIPTS_DIR))
 from dotenv import load_dotenv
 load_dotenv(os.path.expanduser("~/.tinyclaw/polymarket.env"))
 
-from polymarket_api import get_client, get_balance
+from polymarket_api import get_client, get_balance, pace_clob_call
 from weather_arb import (
     get_weather_events, parse_weather_event, analyze_weather_event,
     calculate_probability, prepare_forecasts_for_market, get_ensemble_forecast,
+    CITY_INDEX,
 )
 from early_exit_manager import PositionTracker, Position, ExitRecord, execute_full_exit
+from trading_state_writer import write_state_file
 from py_clob_client.clob_types import OrderArgs, OrderType
 from py_clob_client.order_builder.constants import BUY, SELL
 
@@ -42,33 +65,82 @@ TRADING_STATE_FILE = STATE_DIR / "trading_state.json"
 
 JOURNAL_DIR.mkdir(exist_ok=True)
 
+PRICE_FETCH_WORKERS = 16  # Concurrent order-book requests in get_batch_prices
+
 
 # ---------------------------------------------------------------------------
 # Utility helpers
 # ---------------------------------------------------------------------------
 
-def journal_path() -> Path:
-    return JOURNAL_DIR / f"{datetime.now().strftime('%Y-%m-%d')}.md"
+# Journal lines for the current step; written out in one append by flush_journal()
+_journal_buf: list[str] = []
+_journal_file: Path | None = None
+
+# Today's journal path and the epoch time of the next local midnight, when it goes stale
+_JOURNAL_DATE_CACHE = {'path': None, 'expires': 0.0}
+
+
+def journal_path(now: datetime | None = None) -> Path:
+    if now is not None:
+        return JOURNAL_DIR / f"{now.strftime('%Y-%m-%d')}.md"
+    if time.time() >= _JOURNAL_DATE_CACHE['expires']:
+        today = datetime.now()
+        midnight = datetime.combine(today.date() + timedelta(days=1), datetime.min.time())
+        _JOURNAL_DATE_CACHE['path'] = JOURNAL_DIR / f"{today.strftime('%Y-%m-%d')}.md"
+        _JOURNAL_DATE_CACHE['expires'] = midnight.timestamp()
+    return _JOURNAL_DATE_CACHE['path']
+
+
+def start_journal(now: datetime | None = None):
+    """Resolve today's journal file once for the step about to log."""
+    global _journal_file
+    _journal_file = journal_path(now)
 
 
 def log(text: str):
-    with open(journal_path(), 'a') as f:
-        f.write(text + "\n")
+    _journal_buf.append(text + "\n")
+
+
+def flush_journal():
+    """Append everything logged since the last flush in a single write."""
+    if not _journal_buf:
+        return
+    with open(_journal_file or journal_path(), 'a') as f:
+        f.write(''.join(_journal_buf))
+    _journal_buf.clear()
 
 
 def load_open_orders() -> list:
     if not OPEN_ORDERS_FILE.exists():
         return []
     try:
-        with open(OPEN_ORDERS_FILE) as f:
-            return json.load(f)
+        with open(OPEN_ORDERS_FILE, 'rb') as f:
+            return orjson.loads(f.read()) if HAS_ORJSON else json.load(f)
     except Exception:
         return []
 
 
 def save_open_orders(orders: list):
-    with open(OPEN_ORDERS_FILE, 'w') as f:
-        json.dump(orders, f, indent=2, default=str)
+    write_state_file(OPEN_ORDERS_FILE, orders)
+
+
+def append_open_order(record: dict):
+    """
+    Add one order to open_orders.json as soon as it is live: re-read the file
+    (order_monitor may have updated it since), append, and write atomically.
+    """
+    orders = load_open_orders()
+    orders.append(record)
+    save_open_orders(orders)
+
+
+def dump_pretty(path: Path):
+    """Rewrite a compact state file indented, for manual debugging (--pretty)."""
+    if not path.exists():
+        return
+    with open(path, 'rb') as f:
+        obj = orjson.loads(f.read()) if HAS_ORJSON else json.load(f)
+    write_state_file(path, obj, pretty=True)
 
 
 def position_size_for(balance_usdc: float) -> float:
@@ -80,28 +152,51 @@ def position_size_for(balance_usdc: float) -> float:
     return math.ceil(balance_usdc / 100) * 5.0
 
 
-def hours_to_resolution(market_date_str: str) -> float | None:
-    """Hours until a market resolves. Returns None if unparseable."""
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime | None:
+    """Parse an ISO date string as an aware datetime (naive = UTC). None if unparseable."""
     try:
-        dt = datetime.fromisoformat(str(market_date_str))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return (dt - datetime.now(timezone.utc)).total_seconds() / 3600
-    except Exception:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
         return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def hours_to_resolution(market_date_str: str, now: datetime | None = None) -> float | None:
+    """Hours until a market resolves (relative to `now`, default: current UTC time). None if unparseable."""
+    dt = _parse_iso(str(market_date_str))
+    if dt is None:
+        return None
+    return (dt - (now or datetime.now(timezone.utc))).total_seconds() / 3600
 
 
 # ---------------------------------------------------------------------------
 # Price fetching
 # ---------------------------------------------------------------------------
 
+# get_market responses for the current step, keyed by condition_id.
+# Cleared by main() at the start of each step so prices are never carried over.
+_market_cache: dict[str, dict] = {}
+
+
+def get_market_cached(client, condition_id: str) -> dict:
+    """client.get_market(condition_id), fetched at most once per step."""
+    market = _market_cache.get(condition_id)
+    if market is None:
+        market = client.get_market(condition_id)
+        _market_cache[condition_id] = market
+    return market
+
+
 def get_token_price(client, condition_id: str, side: str) -> tuple[str | None, float | None]:
     """
     Fetch token_id + fresh mid price from CLOB order book.
     Returns (token_id, price) or (None, None).
     """
     try:
-        market = client.get_market(condition_id)
+        market = get_market_cached(client, condition_id)
         for token in market.get('tokens', []):
             if token.get('outcome', '').upper() == side.upper():
                 token_id = token.get('token_id')
@@ -112,41 +207,49 @@ def get_token_price(client, condition_id: str, side: str) -> tuple[str | None, f
     return None, None
 
 
+def _position_mid_price(client, pos) -> float | None:
+    """Mid price from the token's order book, falling back to the market endpoint price."""
+    try:
+        ob = client.get_order_book(pos.token_id)
+        bids = ob.bids or []
+        asks = ob.asks or []
+        best_bid = float(bids[0].price) if bids else None
+        best_ask = float(asks[0].price) if asks else None
+        if best_bid and best_ask:
+            return (best_bid + best_ask) / 2
+        elif best_bid:
+            return best_bid
+        elif best_ask:
+            return best_ask
+    except Exception:
+        pass
+    # Fall back to market endpoint price
+    _, fallback = get_token_price(client, pos.condition_id, pos.side)
+    return fallback
+
+
 def get_batch_prices(client, positions: list) -> dict:
     """
-    Fetch current prices for multiple positions via the batch /prices endpoint.
-    Falls back to individual calls if batch fails.
-    Returns {token_id: price}.
+    Fetch current prices for multiple positions.
+    py-clob-client has no batch mid endpoint, so the per-token order-book calls
+    are fanned out over a thread pool (latency ~ slowest call, not the sum).
+    Returns {token_id: price}, keyed by the positions' token_id strings
+    (PositionTracker normalizes them to str on load).
     """
     results = {}
-    token_ids = [str(p.token_id) for p in positions]
-    if not token_ids:
+    if not positions:
         return results
 
     try:
-        # py-clob-client supports get_prices_history but not a batch mid endpoint directly.
-        # Use get_order_book per token — still one call per token but centralised here.
-        for pos in positions:
-            try:
-                ob = client.get_order_book(str(pos.token_id))
-                bids = ob.bids or []
-                asks = ob.asks or []
-                best_bid = float(bids[0].price) if bids else None
-                best_ask = float(asks[0].price) if asks else None
-                if best_bid and best_ask:
-                    mid = (best_bid + best_ask) / 2
-                elif best_bid:
-                    mid = best_bid
-                elif best_ask:
-                    mid = best_ask
-                else:
-                    # Fall back to market endpoint price
-                    _, fallback = get_token_price(client, pos.condition_id, pos.side)
-                    mid = fallback
-                results[str(pos.token_id)] = mid
-            except Exception:
-                _, fallback = get_token_price(client, pos.condition_id, pos.side)
-                results[str(pos.token_id)] = fallback
+        with ThreadPoolExecutor(max_workers=min(PRICE_FETCH_WORKERS, len(positions))) as pool:
+            futures = {pool.submit(_position_mid_price, client, pos): pos for pos in positions}
+            for future in as_completed(futures):
+                pos = futures[future]
+                try:
+                    results[pos.token_id] = future.result()
+                except Exception as e:
+                    print(f"  Price fetch error for {pos.market_name}: {e}")
+                    results[pos.token_id] = None
     except Exception as e:
         print(f"  Batch price fetch error: {e}")
 
@@ -193,8 +296,9 @@ def startup():
         print(f"\n⚠️  Could not query CLOB open orders: {e}")
         clob_orders = []
 
-    clob_open_ids = {o.get('id') or o.get('orderID') for o in clob_orders}
-    local_open_ids = {o.get('order_id') for o in live_local}
+    # Drop missing ids so a None on either side can't show up as a phantom
+    clob_open_ids = {oid for oid in (o.get('id') or o.get('orderID') for o in clob_orders) if oid}
+    local_open_ids = {oid for oid in (o.get('order_id') for o in live_local) if oid}
 
     # Sync check: warn if local state diverges from CLOB reality
     phantom = local_open_ids - clob_open_ids  # in local but not on CLOB
@@ -228,34 +332,37 @@ def startup():
 # STEP 2: POSITION MONITORING
 # ---------------------------------------------------------------------------
 
-def recalculate_edge(position: Position, current_price: float) -> float:
+def estimate_edge(entry_price: float, original_edge: float | None, current_price: float) -> float:
     """
     Estimate current edge by assuming original forecast probability still holds
     and comparing to fresh market price.
     A proper re-fetch from weather_arb is done in forecast_monitor.py every 2h.
     """
-    original_edge = getattr(position, 'original_edge', None)
     if original_edge is None:
         return 0.0
 
-    # Reconstruct implied forecast probability from entry price + original edge
-    if position.side == 'YES':
-        forecast_prob = position.entry_price + (original_edge / 100)
-        fresh_edge = (forecast_prob - current_price) * 100
-    else:
-        # For NO side: entry_price is the NO price paid (1 - yes_price)
-        # forecast_prob for NO = 1 - yes_forecast_prob
-        forecast_prob = position.entry_price + (original_edge / 100)
-        fresh_edge = (forecast_prob - current_price) * 100
+    # Reconstruct implied forecast probability from entry price + original edge.
+    # Same formula for both sides: for NO, entry_price is the NO price paid
+    # (1 - yes_price) and the implied probability is the NO probability.
+    forecast_prob = entry_price + (original_edge / 100)
+    fresh_edge = (forecast_prob - current_price) * 100
 
     return max(fresh_edge, 0.0)
 
 
-def check_exit_triggers(position: Position, current_price: float) -> tuple[str | None, str | None]:
+def recalculate_edge(position: Position, current_price: float) -> float:
+    """estimate_edge() for a Position."""
+    return estimate_edge(position.entry_price, getattr(position, 'original_edge', None), current_price)
+
+
+# Exit trigger codes, in priority order; index 0 means no trigger
+EXIT_TRIGGERS = (None, 'time', 'stop_loss', 'edge_evap', 'profit')
+
+
+def exit_trigger_code(cost: float, value: float, ttl: float | None, fresh_edge: float) -> int:
     """
-    Check all 4 exit conditions in priority order per TRADING_RULES.md.
-    Priority: Time > Stop Loss > Edge Evaporation > Profit Target
-    Returns (trigger_name, reason) or (None, None).
+    Index into EXIT_TRIGGERS of the first exit condition that fires, per
+    TRADING_RULES.md. Priority: Time > Stop Loss > Edge Evaporation > Profit Target
 
     RESOLUTION PROXIMITY GUARD:
     Within 8 hours of resolution, stop loss and edge evaporation are suppressed.
@@ -263,45 +370,153 @@ def check_exit_triggers(position: Position, current_price: float) -> tuple[str |
     Only time exit and profit target fire in the final 8 hours.
     Consensus hold (checked before this function) handles hold-to-resolution decisions.
     """
-    cost  = position.cost_basis
-    value = position.shares * current_price
-    ttl   = hours_to_resolution(getattr(position, 'market_date', ''))
-
-    # 1. Time exit: < 8 hours to resolution (TRADING_RULES.md Priority 1)
+    # 1. Time exit: < 8 hours to resolution (TRADING_RULES.md Priority 1).
+    #    Everything below therefore only runs outside the proximity guard.
     if ttl is not None and ttl < 8:
-        return 'time', f"Time exit: {ttl:.1f}h to resolution"
+        return 1
+    # 2. Stop loss: value <= 80% of cost
+    if value <= cost * 0.80:
+        return 2
+    # 3. Edge evaporation: recalculated edge < 10%
+    if fresh_edge < 10.0:
+        return 3
+    # 4. Profit target: value >= 130% of cost
+    if value >= cost * 1.30:
+        return 4
+    return 0
 
-    # Resolution proximity guard — suppress volatile exits in final 8h
-    near_resolution = ttl is not None and ttl < 8
 
-    # 2. Stop loss: value <= 80% of cost — suppressed near resolution
-    if not near_resolution and value <= cost * 0.80:
+def exit_reason(code: int, cost: float, value: float, ttl: float | None,
+                fresh_edge: float) -> tuple[str | None, str | None]:
+    """(trigger_name, reason) for an exit_trigger_code() result, or (None, None)."""
+    if code == 1:
+        return 'time', f"Time exit: {ttl:.1f}h to resolution"
+    if code == 2:
         pct = (value / cost - 1) * 100
         return 'stop_loss', f"Stop loss: {pct:.1f}% (value ${value:.2f} <= floor ${cost * 0.80:.2f})"
-
-    # 3. Edge evaporation: recalculated edge < 10% — suppressed near resolution
-    if not near_resolution:
-        fresh_edge = recalculate_edge(position, current_price)
-        if fresh_edge < 10.0:
-            return 'edge_evap', f"Edge evaporation: {fresh_edge:.1f}% < 10%"
-
-    # 4. Profit target: value >= 130% of cost — always active
-    if value >= cost * 1.30:
+    if code == 3:
+        return 'edge_evap', f"Edge evaporation: {fresh_edge:.1f}% < 10%"
+    if code == 4:
         pct = (value / cost - 1) * 100
         return 'profit', f"Profit target: {pct:.1f}% (value ${value:.2f} >= target ${cost * 1.30:.2f})"
-
     return None, None
 
 
-def parse_resolution_time(market_date_str: str) -> datetime:
-    """Parse market_date into a timezone-aware datetime."""
-    try:
-        dt = datetime.fromisoformat(str(market_date_str))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
-    except Exception:
-        return datetime.now(timezone.utc) + timedelta(days=30)
+if HAS_NUMBA:
+    @njit(cache=True, error_model='numpy')
+    def _position_kernel(shares, cost, entry, orig_edge, price, ttl):
+        """
+        Fused single pass of position_metrics(): value, P&L %, estimated edge
+        and exit trigger code per position. NaN marks a missing price,
+        original edge or time to resolution. Mirrors exit_trigger_code().
+        """
+        n = shares.shape[0]
+        value = np.empty(n)
+        pnl_pct = np.empty(n)
+        edge = np.empty(n)
+        code = np.zeros(n, dtype=np.int64)
+        for i in range(n):
+            v = shares[i] * price[i]
+            value[i] = v
+            pnl_pct[i] = (v / cost[i] - 1) * 100
+            e = 0.0
+            if not np.isnan(orig_edge[i]):
+                e = max((entry[i] + orig_edge[i] / 100 - price[i]) * 100, 0.0)
+            edge[i] = e
+            if ttl[i] < 8:
+                code[i] = 1
+            elif v <= cost[i] * 0.80:
+                code[i] = 2
+            elif e < 10.0:
+                code[i] = 3
+            elif v >= cost[i] * 1.30:
+                code[i] = 4
+        return value, pnl_pct, edge, code
+
+
+def warm_up_kernels():
+    """Compile (or load from the on-disk cache) the Numba kernel before the first tick."""
+    if HAS_NUMBA:
+        empty = np.empty(0)
+        _position_kernel(empty, empty, empty, empty, empty, empty)
+
+
+def position_metrics(positions: list, prices: list,
+                     ttls: list) -> tuple[list, list, list, list]:
+    """
+    Value, P&L %, estimated edge (see estimate_edge) and exit trigger code
+    (see exit_trigger_code) for each position at its fresh price and hours to
+    resolution, as parallel lists. Entries for a None price are meaningless.
+    Computed column-wise with NumPy when it is installed, in one compiled
+    pass when Numba is too.
+    """
+    if not HAS_NUMPY:
+        values, pnls, edges, codes = [], [], [], []
+        for pos, price, ttl in zip(positions, prices, ttls):
+            if price is None:
+                values.append(None)
+                pnls.append(None)
+                edges.append(None)
+                codes.append(0)
+                continue
+            value = pos.shares * price
+            edge = estimate_edge(pos.entry_price, pos.original_edge, price)
+            values.append(value)
+            pnls.append((value / pos.cost_basis - 1) * 100)
+            edges.append(edge)
+            codes.append(exit_trigger_code(pos.cost_basis, value, ttl, edge))
+        return values, pnls, edges, codes
+
+    n = len(positions)
+    price  = np.array([np.nan if x is None else x for x in prices], dtype=float)
+    ttl    = np.array([np.nan if x is None else x for x in ttls], dtype=float)
+    shares = np.fromiter((p.shares for p in positions), dtype=float, count=n)
+    cost   = np.fromiter((p.cost_basis for p in positions), dtype=float, count=n)
+    entry  = np.fromiter((p.entry_price for p in positions), dtype=float, count=n)
+    orig   = np.array([np.nan if p.original_edge is None else p.original_edge for p in positions],
+                      dtype=float)
+
+    if HAS_NUMBA:
+        value, pnl_pct, edge, code = _position_kernel(shares, cost, entry, orig, price, ttl)
+    else:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            value = shares * price
+            pnl_pct = (value / cost - 1) * 100
+            edge = np.where(np.isnan(orig), 0.0, np.maximum((entry + orig / 100 - price) * 100, 0.0))
+            code = np.select(
+                [ttl < 8, value <= cost * 0.80, edge < 10.0, value >= cost * 1.30],
+                [1, 2, 3, 4],
+                default=0,
+            )
+    return value.tolist(), pnl_pct.tolist(), edge.tolist(), code.tolist()
+
+
+def exit_trigger(cost: float, value: float, ttl: float | None,
+                 fresh_edge: float) -> tuple[str | None, str | None]:
+    """
+    Check all 4 exit conditions in priority order (see exit_trigger_code).
+    Returns (trigger_name, reason) or (None, None).
+    """
+    return exit_reason(exit_trigger_code(cost, value, ttl, fresh_edge), cost, value, ttl, fresh_edge)
+
+
+def check_exit_triggers(position: Position, current_price: float,
+                        now: datetime | None = None) -> tuple[str | None, str | None]:
+    """exit_trigger() for a Position at current_price."""
+    return exit_trigger(
+        position.cost_basis,
+        position.shares * current_price,
+        hours_to_resolution(getattr(position, 'market_date', ''), now),
+        recalculate_edge(position, current_price),
+    )
+
+
+def parse_resolution_time(market_date_str: str, now: datetime | None = None) -> datetime:
+    """Parse market_date into a timezone-aware datetime (unparseable: 30 days after `now`)."""
+    dt = _parse_iso(str(market_date_str))
+    if dt is None:
+        return (now or datetime.now(timezone.utc)) + timedelta(days=30)
+    return dt
 
 
 def get_required_margin(hours_remaining: float, is_us_market: bool) -> tuple[float, str]:
@@ -335,6 +550,8 @@ def check_consensus_hold(
     threshold: float,
     is_us_market: bool,
     current_price: float,
+    now: datetime | None = None,
+    hours_remaining: float | None = None,
 ) -> tuple[bool, str]:
     """
     Check if position qualifies for hold-to-resolution per Priority 0 exit rule.
@@ -347,6 +564,7 @@ def check_consensus_hold(
 
     Returns (should_hold, reason).
     If True, caller must skip all other exit checks.
+    Callers that already know the hours to resolution can pass hours_remaining.
     """
     if not forecasts or len(forecasts) < 2:
         return False, "Insufficient sources (need ≥2)"
@@ -357,8 +575,10 @@ def check_consensus_hold(
         return False, "No local source — cannot consensus hold"
 
     # Time-to-resolution check
-    resolution_time = parse_resolution_time(getattr(position, 'market_date', ''))
-    hours_remaining = (resolution_time - datetime.now(timezone.utc)).total_seconds() / 3600
+    if hours_remaining is None:
+        now = now or datetime.now(timezone.utc)
+        resolution_time = parse_resolution_time(getattr(position, 'market_date', ''), now)
+        hours_remaining = (resolution_time - now).total_seconds() / 3600
 
     if hours_remaining > 24:
         return False, f"Too far from resolution ({hours_remaining:.1f}h > 24h)"
@@ -422,49 +642,50 @@ def monitor_positions(client, tracker: PositionTracker):
     print(f"STEP 2: POSITION MONITORING ({len(positions)} positions)")
     print(f"{'=' * 70}")
 
-    ts = datetime.now().strftime('%H:%M:%S')
+    # One clock reading for the whole tick (resolution math and journal times)
+    now = datetime.now(timezone.utc)
+    local_now = now.astimezone()
+    ts = local_now.strftime('%H:%M:%S')
+    start_journal(local_now)
     log(f"\n## Monitor — {ts}")
     log("| Market | Entry | Current | P&L % | Edge | Action |")
     log("|--------|-------|---------|-------|------|--------|")
 
-    # Batch price fetch
+    # Batch price fetch, then P&L/edge for every position in one pass
     price_map = get_batch_prices(client, positions)
+    prices = [price_map.get(p.token_id) for p in positions]
+    ttls = [hours_to_resolution(p.market_date, now) for p in positions]  # None if unparseable
+    values, pnls, edges, codes = position_metrics(positions, prices, ttls)
 
-    for pos in positions:
-        current_price = price_map.get(str(pos.token_id))
+    for pos, current_price, ttl, value, pnl_pct, edge, code in zip(
+            positions, prices, ttls, values, pnls, edges, codes):
 
         if current_price is None:
             print(f"  ⚠️  {pos.market_name} — could not fetch price, skipping")
             log(f"| {pos.market_name} | {pos.entry_price * 100:.1f}¢ | N/A | N/A | N/A | SKIP (no price) |")
             continue
 
-        cost    = pos.cost_basis
-        value   = pos.shares * current_price
-        pnl_pct = (value / cost - 1) * 100
-        edge    = recalculate_edge(pos, current_price)
+        # Read each Position field once per iteration
+        market_date_str = pos.market_date
+        pos_is_us       = pos.is_us_market
+        pos_city        = pos.city
+        threshold_raw   = pos.threshold_temp_f
+        cost            = pos.cost_basis
+
+        # Resolution timing, shared by the consensus hold and the exit triggers
+        pos_date   = parse_resolution_time(market_date_str, now)
+        hours_left = (pos_date - now).total_seconds() / 3600
 
         # --- Priority 0: Consensus Hold (runs BEFORE all other exits) ---
         consensus_hold = False
         consensus_reason = ""
         try:
-            market_date_str = getattr(pos, 'market_date', '')
-            pos_date = parse_resolution_time(market_date_str)
-            pos_is_us = getattr(pos, 'is_us_market', False)
             # Fetch fresh forecasts for this position's city and date
-            pos_city = getattr(pos, 'city', '')
-            pos_lat = None
-            pos_lon = None
-            pos_local_source = None
-            from weather_arb import WEATHER_CITIES
-            for c_name, lat, lon, is_us, local_source in WEATHER_CITIES:
-                if c_name.lower() == pos_city.lower() or c_name.title() == pos_city:
-                    pos_lat, pos_lon = lat, lon
-                    pos_local_source = local_source
-                    break
-
-            if pos_lat is not None:
+            city_entry = CITY_INDEX.get(pos_city.lower())  # WEATHER_CITIES keyed by lowercase name
+
+            if city_entry is not None:
+                _, pos_lat, pos_lon, _, pos_local_source = city_entry
                 forecast_date = pos_date.replace(tzinfo=None).date()
-                from datetime import date as date_type
                 forecast_date_dt = datetime.combine(forecast_date, datetime.min.time())
                 ensemble = get_ensemble_forecast(
                     pos_lat, pos_lon, forecast_date_dt,
@@ -476,8 +697,7 @@ def monitor_positions(client, tracker: PositionTracker):
                     indiv = ensemble.get("individual", [])
                     if indiv:
                         converted = prepare_forecasts_for_market(indiv, is_us_market=pos_is_us)
-                        # Parse threshold from Position — stored as threshold_temp_f
-                        threshold_raw = getattr(pos, 'threshold_temp_f', None)
+                        # Threshold from Position — stored as threshold_temp_f
                         if threshold_raw and pos_is_us:
                             threshold = threshold_raw  # already in °F
                         elif threshold_raw and not pos_is_us:
@@ -488,7 +708,8 @@ def monitor_positions(client, tracker: PositionTracker):
 
                         if threshold is not None:
                             consensus_hold, consensus_reason = check_consensus_hold(
-                                pos, converted, threshold, pos_is_us, current_price
+                                pos, converted, threshold, pos_is_us, current_price, now,
+                                hours_remaining=hours_left,
                             )
         except Exception as e:
             consensus_reason = f"Consensus hold check error: {e}"
@@ -496,15 +717,12 @@ def monitor_positions(client, tracker: PositionTracker):
         if consensus_hold:
             # Log consensus hold — do NOT exit
             action = "CONSENSUS HOLD"
-            unit_label = "°F" if getattr(pos, 'is_us_market', False) else "°C"
-            ts_now = datetime.now().strftime('%H:%M:%S')
-            resolution_time = parse_resolution_time(getattr(pos, 'market_date', ''))
-            hours_left = (resolution_time - datetime.now(timezone.utc)).total_seconds() / 3600
+            unit_label = "°F" if pos_is_us else "°C"
             expected_payout = pos.shares * 1.0
-            expected_profit = expected_payout - pos.cost_basis
+            expected_profit = expected_payout - cost
             print(f"  🏁 CONSENSUS HOLD  {pos.market_name}  {current_price * 100:.1f}¢  {pnl_pct:+.1f}%  {hours_left:.1f}h left")
             print(f"     {consensus_reason}")
-            log(f"\n## Monitor — {ts_now}")
+            log(f"\n## Monitor — {ts}")
             log(f"Market: {pos.market_name}")
             log(f"Entry: {pos.side} @ {pos.entry_price * 100:.1f}¢, {pos.shares:.4f} shares, ${pos.cost_basis:.2f} cost")
             log(f"Current: {current_price * 100:.1f}¢ → value ${value:.2f} ({pnl_pct:+.1f}%)")
@@ -514,7 +732,7 @@ def monitor_positions(client, tracker: PositionTracker):
             log(f"Expected profit: ${expected_profit:+.2f} ({expected_profit / pos.cost_basis * 100:+.1f}%)")
         else:
             # Fall through to normal exit logic
-            trigger, reason = check_exit_triggers(pos, current_price)
+            trigger, reason = exit_reason(code, cost, value, ttl, edge)
 
             if trigger:
                 success = execute_full_exit(client, pos, current_price, reason, tracker)
@@ -522,7 +740,7 @@ def monitor_positions(client, tracker: PositionTracker):
                 if success:
                     proceeds = pos.shares * current_price
                     pnl = proceeds - pos.cost_basis
-                    log(f"\n## Exit — {datetime.now().strftime('%H:%M:%S')}")
+                    log(f"\n## Exit — {ts}")
                     log(f"Market: {pos.market_name}")
                     log(f"Side: {pos.side}")
                     log(f"Entry: {pos.entry_price * 100:.1f}¢, {pos.shares:.4f} shares, ${pos.cost_basis:.2f} cost")
@@ -539,6 +757,7 @@ def monitor_positions(client, tracker: PositionTracker):
             f"| {pnl_pct:+.1f}% | {edge:.1f}% | {action} |")
 
     log("")
+    flush_journal()
 
 
 # ---------------------------------------------------------------------------
@@ -600,8 +819,14 @@ def scan_and_trade(client, balance_usdc: float, tracker: PositionTracker):
 
     # --- Weather scan ---
     print("\n  Fetching weather events...")
-    events = get_weather_events(days_ahead=3)
-    qualifying = []
+    now_utc = datetime.now(timezone.utc)
+    events = get_weather_events(days_ahead=3, now=now_utc.astimezone().replace(tzinfo=None))
+    # Only the best few candidates are ever tried (look-ahead buffer for
+    # failures), so keep just those in a bounded min-heap of
+    # (edge, -arrival, candidate); ties keep the earlier arrival
+    candidate_cap = max_new_orders * 3
+    candidates = []
+    num_qualifying = 0
 
     for event in events:
         parsed = parse_weather_event(event)
@@ -610,35 +835,36 @@ def scan_and_trade(client, balance_usdc: float, tracker: PositionTracker):
 
         event_date = parsed.get('date')
         if isinstance(event_date, str):
-            try:
-                event_date = datetime.fromisoformat(event_date)
-            except Exception:
+            event_date = _parse_iso(event_date)  # memoized, naive -> UTC
+            if event_date is None:
                 continue
-
-        if event_date.tzinfo is None:
+        elif event_date.tzinfo is None:
             event_date = event_date.replace(tzinfo=timezone.utc)
 
         # Must resolve in >4h and ≤72h
-        hours_away = (event_date - datetime.now(timezone.utc)).total_seconds() / 3600
+        hours_away = (event_date - now_utc).total_seconds() / 3600
         if hours_away < 4 or hours_away > 72:
             continue
 
         opps = analyze_weather_event(parsed)
+        if not opps:
+            continue
 
-        for opp in opps:
-            edge  = opp.get('confidence_adjusted_edge', 0)
-            conf  = opp.get('forecast_confidence', 0)
-            yes_p = opp.get('market_yes_price', 0)
-            no_p  = opp.get('market_no_price', 1)
-            sources    = opp.get('forecast_sources', [])
-            num_sources = len(sources)
-            is_us = 'noaa' in [s.lower() for s in sources]
-            has_local = opp.get('local_source') is not None
-            action = opp.get('action', '')
+        # slug -> raw market, built once per event (first market wins on a repeated slug)
+        markets_by_slug = {}
+        for mkt in event.get('markets', []):
+            if mkt.get('slug'):
+                markets_by_slug.setdefault(mkt['slug'], mkt)
+        event_id = event.get('id', '')
 
+        for opp in opps:
             # --- Entry filter per TRADING_RULES.md ---
+            # Cheapest and most selective checks first; source scans, the
+            # per-source temperature spread and the market lookup run only
+            # for candidates that survive the scalar filters.
 
             # Confidence floor ≥80%
+            conf = opp.get('forecast_confidence', 0)
             if conf < 0.80:
                 continue
 
@@ -646,17 +872,32 @@ def scan_and_trade(client, balance_usdc: float, tracker: PositionTracker):
             if opp.get('local_disagrees', False):
                 continue
 
-            # Edge threshold: ≥20% for US + non-US with local source; ≥25% without local
-            min_edge = 20.0 if (is_us or has_local) else 25.0
-            if edge < min_edge:
+            # Edge floor: no market qualifies below 20% (25% without local source, below)
+            edge = opp.get('confidence_adjusted_edge', 0)
+            if edge < 20.0:
                 continue
 
             # Price range 30–70¢ for the side we're buying
+            action = opp.get('action', '')
             side = "YES" if "YES" in action.upper() else "NO"
-            buy_price = yes_p if side == "YES" else no_p
+            buy_price = opp.get('market_yes_price', 0) if side == "YES" else opp.get('market_no_price', 1)
             if not (0.30 <= buy_price <= 0.70):
                 continue
 
+            # Liquidity ≥$500
+            liquidity = opp.get('liquidity', 0) or 0
+            if liquidity < 500:
+                continue
+
+            sources    = opp.get('forecast_sources', [])
+            num_sources = len(sources)
+            is_us = any(s.lower() == 'noaa' for s in sources)
+            has_local = opp.get('local_source') is not None
+
+            # Edge threshold: ≥20% for US + non-US with local source; ≥25% without local
+            if not (is_us or has_local) and edge < 25.0:
+                continue
+
             # Source requirements
             if is_us and num_sources < 3:
                 continue
@@ -671,21 +912,11 @@ def scan_and_trade(client, balance_usdc: float, tracker: PositionTracker):
                     if max(temps) - min(temps) > 1.0:
                         continue
 
-            # Liquidity ≥$500
-            liquidity = opp.get('liquidity', 0) or 0
-            if liquidity < 500:
-                continue
-
             # Resolve condition_id from the event's raw market data
             # The opp's 'slug' matches the market slug in the event's markets list
             opp_slug = opp.get('slug', '')
-            condition_id = None
-            event_id = event.get('id', '')
-
-            for mkt in event.get('markets', []):
-                if mkt.get('slug', '') == opp_slug:
-                    condition_id = mkt.get('conditionId')
-                    break
+            mkt = markets_by_slug.get(opp_slug)
+            condition_id = mkt.get('conditionId') if mkt else None
 
             if not condition_id:
                 continue
@@ -698,7 +929,11 @@ def scan_and_trade(client, balance_usdc: float, tracker: PositionTracker):
             if event_id and event_id in existing_event_ids:
                 continue
 
-            qualifying.append({
+            num_qualifying += 1
+            if len(candidates) >= candidate_cap and edge <= candidates[0][0]:
+                continue  # not better than the weakest candidate already kept
+
+            candidate = {
                 'condition_id': condition_id,
                 'event_id': event_id,
                 'city': opp.get('city', ''),
@@ -717,17 +952,30 @@ def scan_and_trade(client, balance_usdc: float, tracker: PositionTracker):
                 'individual_forecasts': opp.get('individual_forecasts', []),
                 'local_source': opp.get('local_source'),
                 'local_disagrees': opp.get('local_disagrees', False),
-            })
+            }
+            if len(candidates) < candidate_cap:
+                heapq.heappush(candidates, (edge, -num_qualifying, candidate))
+            else:
+                heapq.heapreplace(candidates, (edge, -num_qualifying, candidate))
 
-    qualifying.sort(key=lambda x: x['edge'], reverse=True)
-    print(f"\n  Qualifying (≥20% edge, 30–70¢, conf ≥80%, liq ≥$500): {len(qualifying)}")
+    top_candidates = [c for _, _, c in sorted(candidates, reverse=True)]
+    print(f"\n  Qualifying (≥20% edge, 30–70¢, conf ≥80%, liq ≥$500): {num_qualifying}")
 
     ts = datetime.now().strftime('%H:%M:%S')
     orders_placed = 0
     placed_list = []
     skipped_list = []
 
-    for opp in qualifying[:max_new_orders * 3]:  # look-ahead buffer for failures
+    # Balance as fetched just before the scan. Orders placed in this loop are
+    # covered by `needed` below, so the CLOB is only re-queried after a failed
+    # placement (when the real balance is uncertain), not once per candidate.
+    bal_now = balance_usdc
+
+    # Placements are paced by the shared CLOB token bucket (see pace_clob_call);
+    # a fixed pause between orders only kicks in once the CLOB has answered 429
+    backoff = 0.0
+
+    for opp in top_candidates:
         if orders_placed >= max_new_orders:
             break
 
@@ -735,11 +983,10 @@ def scan_and_trade(client, balance_usdc: float, tracker: PositionTracker):
         side = opp['side']
         cid  = opp['condition_id']
 
-        # --- Live balance re-check ---
-        bal_now = get_balance(client)
+        # --- Balance check ---
         needed = (orders_placed + 1) * pos_size + 5  # +$5 buffer
-        if bal_now['balance_usdc'] < needed:
-            skipped_list.append(f"{city}: insufficient balance (${bal_now['balance_usdc']:.2f} < ${needed:.2f})")
+        if bal_now < needed:
+            skipped_list.append(f"{city}: insufficient balance (${bal_now:.2f} < ${needed:.2f})")
             break
 
         # --- Live price re-validation from CLOB ---
@@ -754,13 +1001,11 @@ def scan_and_trade(client, balance_usdc: float, tracker: PositionTracker):
             skipped_list.append(f"{city} {side}: live price {fresh_price * 100:.1f}¢ outside 30–70¢")
             continue
 
-        # Re-calculate edge at live price
+        # Re-calculate confidence-adjusted edge at live price. forecast_prob is
+        # the YES probability; fresh_price is the price of the side we buy.
         fp = opp['forecast_prob']
-        if side == 'NO':
-            fresh_edge = (fp - fresh_price) * 100
-        else:
-            fresh_edge = (fp - fresh_price) * 100
-        fresh_edge = fresh_edge * opp['conf']  # confidence-adjusted
+        side_prob = fp if side == 'YES' else 1 - fp
+        fresh_edge = (side_prob - fresh_price) * 100 * opp['conf']
 
         live_min_edge = 20.0 if (opp.get('is_us') or opp.get('local_source') is not None) else 25.0
         if fresh_edge < live_min_edge:
@@ -779,6 +1024,7 @@ def scan_and_trade(client, balance_usdc: float, tracker: PositionTracker):
                 side=BUY,
             )
             signed = client.create_order(order_args)
+            pace_clob_call("order")
             resp   = client.post_order(signed, orderType=OrderType.GTC)
             order_id = resp.get('orderID', 'N/A')
 
@@ -805,12 +1051,11 @@ def scan_and_trade(client, balance_usdc: float, tracker: PositionTracker):
                 'temp_bucket' : opp['temp_bucket'],
                 'time_placed' : now.isoformat(),
                 'ttl_expiry'  : ttl.isoformat(),
+                'ttl_expiry_epoch': int(ttl.timestamp()),  # order_monitor compares this, not the ISO string
                 'status'      : 'OPEN',
             }
 
-            all_orders = load_open_orders()
-            all_orders.append(order_record)
-            save_open_orders(all_orders)
+            append_open_order(order_record)
             existing_cids.add(cid)
             existing_event_ids.add(opp['event_id'])
             orders_placed += 1
@@ -825,14 +1070,19 @@ def scan_and_trade(client, balance_usdc: float, tracker: PositionTracker):
             if "403" in err or "regional" in err.lower():
                 print("     🚫 Geo-block detected — stopping")
                 break
+            if "429" in err:
+                backoff = 0.4
+            bal_now = get_balance(client).get('balance_usdc', bal_now)
 
-        time.sleep(0.4)
+        if backoff:
+            time.sleep(backoff)
 
     # --- Journal scan summary ---
+    start_journal()
     log(f"\n## Scan — {ts}")
     log(f"Balance: ${balance_usdc:.2f}")
     log(f"Markets scanned: {len(events)}")
-    log(f"Qualifying (≥20% edge): {len(qualifying)}")
+    log(f"Qualifying (≥20% edge): {num_qualifying}")
     log(f"Passed live re-validation: {orders_placed}")
     log(f"Orders placed: {orders_placed}")
     for p in placed_list:
@@ -842,6 +1092,7 @@ def scan_and_trade(client, balance_usdc: float, tracker: PositionTracker):
         for s in skipped_list:
             log(f"  - {s}")
     log("")
+    flush_journal()
 
 
 # ---------------------------------------------------------------------------
@@ -859,7 +1110,7 @@ def update_state(client, tracker: PositionTracker):
         "wallet"        : f"{bal['wallet'][:6]}...{bal['wallet'][-4:]}",
         "balance_usdc"  : bal['balance_usdc'],
         "open_orders"   : [o for o in open_orders if o.get('status') == 'OPEN'],
-        "positions"     : [vars(p) for p in positions],
+        "positions"     : [p.as_dict() for p in positions],
         "strategy": {
             "min_edge_pct"             : 20.0,
             "position_size_usd"        : 5.0,
@@ -876,8 +1127,7 @@ def update_state(client, tracker: PositionTracker):
         },
     }
 
-    with open(TRADING_STATE_FILE, 'w') as f:
-        json.dump(state, f, indent=2, default=str)
+    write_state_file(TRADING_STATE_FILE, state)
 
     tracker.save_state()
 
@@ -897,25 +1147,42 @@ def update_state(client, tracker: PositionTracker):
 # Main
 # ---------------------------------------------------------------------------
 
-def main():
+def main(pretty: bool = False):
     # STEP 1: Startup + sync check
     client, balance_usdc, tracker, open_orders = startup()
+    warm_up_kernels()
 
     if balance_usdc < 10:
         print("\nStopping — balance below $10 hard floor")
         update_state(client, tracker)
         return
 
-    # STEP 2: Monitor existing positions for exit triggers
-    monitor_positions(client, tracker)
-
-    # STEP 3: Scan for new opportunities (reload balance after any exits)
-    fresh_bal = get_balance(client)
-    scan_and_trade(client, fresh_bal['balance_usdc'], tracker)
+    try:
+        # STEP 2: Monitor existing positions for exit triggers
+        _market_cache.clear()
+        monitor_positions(client, tracker)
+
+        # STEP 3: Scan for new opportunities (reload balance after any exits)
+        _market_cache.clear()
+        fresh_bal = get_balance(client)
+        scan_and_trade(client, fresh_bal['balance_usdc'], tracker)
+    finally:
+        # Keep whatever a step logged before it raised
+        flush_journal()
 
     # STEP 4: Final state update
     update_state(client, tracker)
 
+    if pretty:
+        for path in (OPEN_ORDERS_FILE, TRADING_STATE_FILE):
+            dump_pretty(path)
+
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Autonomous weather arbitrage trader v2")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Leave open_orders.json and trading_state.json indented after the run")
+    args = parser.parse_args()
+    main(pretty=args.pretty)
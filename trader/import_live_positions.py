@@ -23,9 +23,16 @@ Notes:
 import sys
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 TRADER_DIR = Path(__file__).parent
 SCRIPTS_DIR = TRADER_DIR / "polymarket-trader" / "scripts"
 sys.path.insert(0, str(SCRIPTS_DIR))
@@ -35,6 +42,23 @@ from early_exit_manager import PositionTracker, Position
 
 POSITION_STATE_FILE = TRADER_DIR / "polymarket-trader" / "positions_state.json"
 
+# Market question patterns (see parse_market_question)
+_CITY_RE = re.compile(r'temperature in (.+?) be', re.IGNORECASE)
+_DATE_RE = re.compile(
+    r'on (January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d+)[\?,]?(?:\s+(\d{4}))?',
+    re.IGNORECASE
+)
+_TEMP_RE = re.compile(r'(\d+(?:\.\d+)?)[°\u00b0]([FC])\s*(or higher|or below)?', re.IGNORECASE)
+
+# Cities whose markets settle in °F on NOAA data
+US_CITIES = frozenset({'Chicago', 'Dallas', 'Miami', 'Houston', 'Phoenix',
+                       'Atlanta', 'Los Angeles', 'New York', 'Seattle', 'Denver'})
+
+MARKET_FETCH_WORKERS = 8  # Concurrent get_market lookups in main()
+
+# condition_id -> client.get_market() response; YES and NO holdings share a market
+_MARKET_CACHE: dict[str, dict] = {}
+
 
 def parse_market_question(question: str):
     """
@@ -55,15 +79,12 @@ def parse_market_question(question: str):
     }
 
     # Extract city: "highest temperature in CITY be ..."
-    city_match = re.search(r'temperature in (.+?) be', question, re.IGNORECASE)
+    city_match = _CITY_RE.search(question)
     if city_match:
         result['city'] = city_match.group(1).strip()
 
     # Extract date: "on Month Day?" or "on Month Day, Year?"
-    date_match = re.search(
-        r'on (January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d+)[\?,]?(?:\s+(\d{4}))?',
-        question, re.IGNORECASE
-    )
+    date_match = _DATE_RE.search(question)
     if date_match:
         month = date_match.group(1)
         day = int(date_match.group(2))
@@ -76,7 +97,7 @@ def parse_market_question(question: str):
 
     # Extract threshold and direction
     # Patterns: "54°F or higher", "65°F or below", "27°C"
-    temp_match = re.search(r'(\d+(?:\.\d+)?)[°\u00b0]([FC])\s*(or higher|or below)?', question, re.IGNORECASE)
+    temp_match = _TEMP_RE.search(question)
     if temp_match:
         value = float(temp_match.group(1))
         unit = temp_match.group(2).upper()
@@ -112,52 +133,96 @@ def fetch_filled_positions(client):
     print(f"Found {len(trades)} trades")
 
     # Group by token_id: accumulate shares
-    # BUY adds shares, SELL subtracts
-    holdings = {}
+    # BUY adds shares, SELL subtracts. Per-token metadata lives in `holdings`
+    # (indexed via token_index); the share/cost deltas are kept as parallel
+    # columns and netted per token in one vectorized pass at the end.
+    token_index = {}
+    holdings = []
+    idx = []
+    share_delta = []
+    cost_delta = []
 
     for trade in trades:
         token_id = trade.get('asset_id') or trade.get('token_id', '')
+        if not token_id:
+            continue
+
         side = trade.get('side', '').upper()
         size = float(trade.get('size', 0))
         price = float(trade.get('price', 0))
-        condition_id = trade.get('market_id', '')
-        outcome = trade.get('outcome', '')
-        matched_time = trade.get('match_time', '') or trade.get('created_at', '')
-
-        if not token_id:
-            continue
 
-        if token_id not in holdings:
-            holdings[token_id] = {
+        i = token_index.get(token_id)
+        if i is None:
+            i = token_index[token_id] = len(holdings)
+            holdings.append({
                 'token_id': token_id,
-                'condition_id': condition_id,
-                'outcome': outcome,
+                'condition_id': trade.get('market_id', ''),
+                'outcome': trade.get('outcome', ''),
                 'shares': 0.0,
                 'cost_basis': 0.0,
                 'last_buy_price': 0.0,
                 'last_buy_time': '',
                 'order_id': trade.get('id', ''),
-            }
+            })
 
         if side == 'BUY':
-            holdings[token_id]['shares'] += size
-            holdings[token_id]['cost_basis'] += size * price
-            holdings[token_id]['last_buy_price'] = price
-            holdings[token_id]['last_buy_time'] = matched_time
+            sign = 1.0
+            holdings[i]['last_buy_price'] = price
+            holdings[i]['last_buy_time'] = trade.get('match_time', '') or trade.get('created_at', '')
         elif side == 'SELL':
-            holdings[token_id]['shares'] -= size
-            holdings[token_id]['cost_basis'] -= size * price
+            sign = -1.0
+        else:
+            continue
+
+        idx.append(i)
+        share_delta.append(sign * size)
+        cost_delta.append(sign * (size * price))
+
+    if HAS_NUMPY:
+        # Weighted bincount: a per-token sum in one C loop, in trade order
+        idx = np.asarray(idx, dtype=np.intp)
+        shares = np.bincount(idx, weights=share_delta, minlength=len(holdings)).tolist()
+        cost = np.bincount(idx, weights=cost_delta, minlength=len(holdings)).tolist()
+    else:
+        shares = [0.0] * len(holdings)
+        cost = [0.0] * len(holdings)
+        for i, q, c in zip(idx, share_delta, cost_delta):
+            shares[i] += q
+            cost[i] += c
 
     # Filter: only positions with positive shares remaining
-    open_positions = [
-        h for h in holdings.values()
-        if h['shares'] > 0.01  # ignore dust
-    ]
+    open_positions = []
+    for h, q, c in zip(holdings, shares, cost):
+        if q > 0.01:  # ignore dust
+            h['shares'] = q
+            h['cost_basis'] = c
+            open_positions.append(h)
 
     print(f"Open positions (positive token balance): {len(open_positions)}")
     return open_positions
 
 
+def fetch_market(client, cid):
+    """client.get_market(cid), reusing _MARKET_CACHE."""
+    market = _MARKET_CACHE.get(cid)
+    if market is None:
+        market = client.get_market(cid)
+        _MARKET_CACHE[cid] = market
+    return market
+
+
+def prefetch_markets(client, cids):
+    """Warm _MARKET_CACHE concurrently, one get_market round trip per condition_id."""
+    def fetch(cid):
+        try:
+            fetch_market(client, cid)
+        except Exception:
+            pass  # enrich_with_market_data retries and reports it
+
+    with ThreadPoolExecutor(max_workers=MARKET_FETCH_WORKERS) as pool:
+        list(pool.map(fetch, cids))
+
+
 def enrich_with_market_data(client, holding):
     """
     Fetch market info to get the question text for a token's condition_id.
@@ -169,7 +234,7 @@ def enrich_with_market_data(client, holding):
         return '', ''
 
     try:
-        market = client.get_market(cid)
+        market = fetch_market(client, cid)
         question = market.get('question', '')
         tokens = market.get('tokens', [])
 
@@ -219,6 +284,15 @@ def main():
     added = 0
     skipped = 0
 
+    # Token IDs already tracked (or imported earlier in this run, even on a dry run)
+    existing_tokens = set(tracker.positions)
+    new_holdings = [h for h in holdings if h['token_id'] not in existing_tokens]
+
+    # Market metadata for every holding not yet tracked: fetch each condition_id
+    # once, concurrently (YES and NO holdings share a market), then read the cache
+    prefetch_markets(client, {h['condition_id'] for h in new_holdings if h.get('condition_id')})
+    market_info = {h['token_id']: enrich_with_market_data(client, h) for h in new_holdings}
+
     for h in holdings:
         token_id = h['token_id']
         condition_id = h['condition_id']
@@ -226,13 +300,13 @@ def main():
         cost_basis = max(h['cost_basis'], 0.0)
 
         # Avoid duplicate imports
-        if token_id in tracker.positions:
+        if token_id in existing_tokens:
             print(f"  SKIP (already tracked): {token_id[:20]}...")
             skipped += 1
             continue
 
         # Get market question for metadata
-        question, outcome = enrich_with_market_data(client, h)
+        question, outcome = market_info[token_id]
         if not question:
             question = f"Unknown market ({condition_id[:20]}...)"
         if not outcome:
@@ -271,13 +345,13 @@ def main():
             threshold_temp_f=threshold_f,
             city=city,
             market_date=market_date_str,
-            is_us_market=(city in {'Chicago', 'Dallas', 'Miami', 'Houston', 'Phoenix',
-                                   'Atlanta', 'Los Angeles', 'New York', 'Seattle', 'Denver'}),
+            is_us_market=(city in US_CITIES),
             forecast_sources='',
         )
 
         if not args.dry_run:
             tracker.add_position(position)
+        existing_tokens.add(token_id)
         added += 1
         print(f"    ✅ {'Would add' if args.dry_run else 'Added to tracker'}")
 
@@ -10,11 +10,19 @@ Checks all open orders and:
 Run frequency: Every 5 minutes
 """
 
+import re
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Add scripts to path
 TRADER_DIR = Path(__file__).parent
 SCRIPTS_DIR = TRADER_DIR / "polymarket-trader" / "scripts"
@@ -23,7 +31,7 @@ sys.path.insert(0, str(SCRIPTS_DIR))
 from polymarket_api import get_client, get_balance
 from early_exit_manager import PositionTracker, Position
 from trading_state_writer import (
-    write_trading_state, log_order_filled, log_order_cancelled
+    write_trading_state, write_state_file, log_order_filled, log_order_cancelled
 )
 
 # Files
@@ -33,6 +41,11 @@ POSITION_STATE_FILE = STATE_DIR / "positions_state.json"
 JOURNAL_DIR = TRADER_DIR / "polymarket-trader" / "journal"
 JOURNAL_DIR.mkdir(exist_ok=True)
 
+STATUS_CHECK_WORKERS = 8  # Concurrent get_order lookups (the shared CLOB token bucket still applies)
+
+# Threshold temperature in a market question, e.g. "80°F"
+_THRESH_RE = re.compile(r'(\d+)°?F')
+
 def get_todays_journal():
     """Get today's journal file."""
     today = datetime.now().strftime("%Y-%m-%d")
@@ -44,78 +57,129 @@ def load_open_orders():
         return []
 
     try:
-        with open(OPEN_ORDERS_FILE, 'r') as f:
-            return json.load(f)
+        with open(OPEN_ORDERS_FILE, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if HAS_ORJSON else json.loads(data)
     except:
         return []
 
 def save_open_orders(orders):
-    """Save open orders to JSON file."""
-    with open(OPEN_ORDERS_FILE, 'w') as f:
-        json.dump(orders, f, indent=2)
-
-def log_order_fill(order_data, fill_data):
-    """Log order fill to daily journal."""
-    journal = get_todays_journal()
-
-    with open(journal, 'a') as f:
-        f.write(f"\n## Order Filled - {datetime.now().strftime('%H:%M:%S')}\n\n")
-        f.write(f"**Market**: {order_data['market']}\n")
-        f.write(f"**Action**: BUY {order_data['side']}\n")
-        f.write(f"**Price**: {order_data['price']*100:.1f}¢\n")
-        f.write(f"**Amount**: ${order_data['amount']:.2f}\n")
-        f.write(f"**Edge**: {order_data.get('edge', 0):.1f}%\n")
-        f.write(f"**Order ID**: {order_data['order_id']}\n")
-        f.write(f"**Time Placed**: {order_data['time_placed']}\n")
-        f.write(f"**Fill Time**: {datetime.now().isoformat()}\n")
-        f.write(f"**Shares**: {fill_data['shares']:.2f}\n")
-        f.write(f"**Status**: ✅ FILLED\n")
-        f.write("\n")
-
-def log_order_cancellation(order_data, reason):
-    """Log order cancellation to daily journal."""
-    journal = get_todays_journal()
-
-    with open(journal, 'a') as f:
-        f.write(f"\n## Order Cancelled - {datetime.now().strftime('%H:%M:%S')}\n\n")
-        f.write(f"**Market**: {order_data['market']}\n")
-        f.write(f"**Action**: BUY {order_data['side']}\n")
-        f.write(f"**Price**: {order_data['price']*100:.1f}¢\n")
-        f.write(f"**Amount**: ${order_data['amount']:.2f}\n")
-        f.write(f"**Order ID**: {order_data['order_id']}\n")
-        f.write(f"**Reason**: {reason}\n")
-        f.write(f"**Status**: ❌ CANCELLED\n")
-        f.write("\n")
-
-def check_order_status(client, order_id):
+    """Save open orders to JSON file (compact, swapped in atomically)."""
+    write_state_file(OPEN_ORDERS_FILE, orders)
+
+def save_order_updates(changed):
+    """
+    Write the changed order dicts into open_orders.json, merged by order_id
+    into the file as it is now, so orders the trader appended since this run
+    loaded the file are kept. Returns the merged list.
+    """
+    by_id = {o['order_id']: o for o in changed}
+    merged = [by_id.pop(o.get('order_id'), o) for o in load_open_orders()]
+    merged.extend(by_id.values())
+    save_open_orders(merged)
+    return merged
+
+def format_order_fill(order_data, fill_data):
+    """Journal entry for an order fill."""
+    now = datetime.now()
+    return (
+        f"\n## Order Filled - {now.strftime('%H:%M:%S')}\n\n"
+        f"**Market**: {order_data['market']}\n"
+        f"**Action**: BUY {order_data['side']}\n"
+        f"**Price**: {order_data['price']*100:.1f}¢\n"
+        f"**Amount**: ${order_data['amount']:.2f}\n"
+        f"**Edge**: {order_data.get('edge', 0):.1f}%\n"
+        f"**Order ID**: {order_data['order_id']}\n"
+        f"**Time Placed**: {order_data['time_placed']}\n"
+        f"**Fill Time**: {now.isoformat()}\n"
+        f"**Shares**: {fill_data['shares']:.2f}\n"
+        f"**Status**: ✅ FILLED\n"
+        "\n"
+    )
+
+def format_order_cancellation(order_data, reason):
+    """Journal entry for an order cancellation."""
+    return (
+        f"\n## Order Cancelled - {datetime.now().strftime('%H:%M:%S')}\n\n"
+        f"**Market**: {order_data['market']}\n"
+        f"**Action**: BUY {order_data['side']}\n"
+        f"**Price**: {order_data['price']*100:.1f}¢\n"
+        f"**Amount**: ${order_data['amount']:.2f}\n"
+        f"**Order ID**: {order_data['order_id']}\n"
+        f"**Reason**: {reason}\n"
+        f"**Status**: ❌ CANCELLED\n"
+        "\n"
+    )
+
+def write_journal(entries):
+    """Append journal entries to today's journal in a single write."""
+    if not entries:
+        return
+    with open(get_todays_journal(), 'a') as f:
+        f.write(''.join(entries))
+
+def ttl_expiry_epoch(order):
+    """
+    Order TTL as a Unix timestamp. Uses the numeric ttl_expiry_epoch written
+    at placement; older records only have the ISO ttl_expiry string.
+    """
+    epoch = order.get('ttl_expiry_epoch')
+    if epoch is None:
+        epoch = datetime.fromisoformat(order['ttl_expiry']).timestamp()
+    return epoch
+
+def fetch_live_orders(client):
+    """
+    Fetch all live orders in one request, keyed by order ID.
+    Returns None if the request fails (callers then query orders one by one).
+    """
+    try:
+        orders = client.get_orders() or []
+    except Exception as e:
+        print(f"Error fetching live orders: {e}")
+        return None
+    return {o.get('id') or o.get('orderID'): o for o in orders}
+
+def parse_order_status(order):
+    """
+    Map a CLOB order record to ('FILLED', fill_details), ('OPEN', None),
+    ('NOT_FOUND', None) or (other status, None).
+    """
+    if not order:
+        return 'NOT_FOUND', None
+
+    # Check status
+    status = order.get('status', '').upper()
+
+    if status == 'MATCHED' or status == 'FILLED':
+        # Extract fill details
+        fill_details = {
+            'price': float(order.get('price', 0)),
+            'size': float(order.get('size', 0)),
+            'shares': float(order.get('size', 0))  # Size is in shares
+        }
+        return 'FILLED', fill_details
+    elif status == 'LIVE' or status == 'OPEN':
+        return 'OPEN', None
+    else:
+        # CANCELLED, EXPIRED, etc.
+        return status, None
+
+def check_order_status(client, order_id, live_orders=None):
     """
     Check if order is filled or still open.
+    live_orders is the fetch_live_orders() result for this run: orders found
+    there are resolved without a request. The live list only holds resting
+    orders, so anything missing from it (filled, cancelled) is still
+    looked up individually.
     Returns: ('FILLED', fill_details) or ('OPEN', None) or ('NOT_FOUND', None)
     """
+    if live_orders is not None and order_id in live_orders:
+        return parse_order_status(live_orders[order_id])
+
     try:
         # Get order status from API
-        order = client.get_order(order_id)
-
-        if not order:
-            return 'NOT_FOUND', None
-
-        # Check status
-        status = order.get('status', '').upper()
-
-        if status == 'MATCHED' or status == 'FILLED':
-            # Extract fill details
-            fill_details = {
-                'price': float(order.get('price', 0)),
-                'size': float(order.get('size', 0)),
-                'shares': float(order.get('size', 0))  # Size is in shares
-            }
-            return 'FILLED', fill_details
-        elif status == 'LIVE' or status == 'OPEN':
-            return 'OPEN', None
-        else:
-            # CANCELLED, EXPIRED, etc.
-            return status, None
-
+        return parse_order_status(client.get_order(order_id))
     except Exception as e:
         print(f"    Error checking order {order_id[:8]}: {e}")
         return 'ERROR', None
@@ -136,15 +200,15 @@ def main():
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
 
-    # Load open orders
-    open_orders = load_open_orders()
+    # Load open orders once; status updates are made on this list and saved at the end
+    all_orders = load_open_orders()
 
-    if not open_orders:
+    if not all_orders:
         print("✅ No open orders to monitor")
         return
 
     # Filter for OPEN status only
-    open_orders = [o for o in open_orders if o.get('status') == 'OPEN']
+    open_orders = [o for o in all_orders if o.get('status') == 'OPEN']
 
     if not open_orders:
         print("✅ No open orders to monitor (all filled/cancelled)")
@@ -157,12 +221,28 @@ def main():
     client = get_client(signature_type=1)
     tracker = PositionTracker(POSITION_STATE_FILE)
 
+    # One request for every resting order instead of one per tracked order
+    live_orders = fetch_live_orders(client)
+
     # Track changes
     filled_count = 0
     cancelled_count = 0
     still_open_count = 0
-
-    all_orders = load_open_orders()  # Load full list for updates
+    recent_activity = None  # Activity events for this run, written once after the loop
+    changed = []  # Orders whose status changed this run
+    journal_entries = []  # Fill/cancellation entries, appended to the journal once after the loop
+
+    # One clock reading for all TTL decisions in this pass
+    now = datetime.now(timezone.utc)
+    now_ts = now.timestamp()
+
+    # Look up every unexpired order's status up front, concurrently: orders
+    # missing from live_orders each cost a CLOB round trip
+    to_check = [o['order_id'] for o in open_orders
+                if now_ts <= ttl_expiry_epoch(o)]
+    with ThreadPoolExecutor(max_workers=STATUS_CHECK_WORKERS) as pool:
+        statuses = dict(zip(to_check, pool.map(
+            lambda oid: check_order_status(client, oid, live_orders), to_check)))
 
     for order in open_orders:
         order_id = order['order_id']
@@ -175,10 +255,9 @@ def main():
         print(f"  Order ID: {order_id[:16]}...")
 
         # Check TTL expiry
-        ttl_expiry = datetime.fromisoformat(order['ttl_expiry'])
-        now = datetime.now(timezone.utc)
+        ttl_expiry = ttl_expiry_epoch(order)
 
-        if now > ttl_expiry:
+        if now_ts > ttl_expiry:
             print(f"  ⏰ TTL EXPIRED (placed {order['time_placed']}, expired {order['ttl_expiry']})")
             print(f"  Cancelling order...")
 
@@ -186,23 +265,16 @@ def main():
             if cancel_order(client, order_id):
                 print(f"  ✅ Order cancelled")
 
-                # Update status
-                for o in all_orders:
-                    if o['order_id'] == order_id:
-                        o['status'] = 'CANCELLED'
-                        o['cancellation_reason'] = 'TTL_EXPIRED'
-                        o['cancellation_time'] = now.isoformat()
+                # Update status (order is the same dict as its entry in all_orders)
+                order['status'] = 'CANCELLED'
+                order['cancellation_reason'] = 'TTL_EXPIRED'
+                order['cancellation_time'] = now.isoformat()
+                changed.append(order)
 
                 # Log cancellation
-                log_order_cancellation(order, "TTL_EXPIRED (30 min)")
+                journal_entries.append(format_order_cancellation(order, "TTL_EXPIRED (30 min)"))
                 cancelled_count += 1
-
-                # Update trading state
-                current_balance = get_balance(client)
-                all_positions = [vars(p) for p in tracker.get_active_positions()]
-                recent_activity = log_order_cancelled(order, "TTL_EXPIRED")
-                write_trading_state(current_balance, all_orders, all_positions, recent_activity)
-                print(f"  📊 Trading state updated")
+                recent_activity = log_order_cancelled(order, "TTL_EXPIRED", recent_activity)
             else:
                 print(f"  ❌ Failed to cancel (may already be filled)")
 
@@ -210,7 +282,7 @@ def main():
             continue
 
         # Check order status
-        status, fill_details = check_order_status(client, order_id)
+        status, fill_details = statuses[order_id]
 
         if status == 'FILLED':
             print(f"  ✅ ORDER FILLED!")
@@ -218,14 +290,13 @@ def main():
             print(f"  Shares: {fill_details['shares']:.2f}")
 
             # Update status
-            for o in all_orders:
-                if o['order_id'] == order_id:
-                    o['status'] = 'FILLED'
-                    o['fill_time'] = now.isoformat()
-                    o['fill_details'] = fill_details
+            order['status'] = 'FILLED'
+            order['fill_time'] = now.isoformat()
+            order['fill_details'] = fill_details
+            changed.append(order)
 
             # Log fill
-            log_order_fill(order, fill_details)
+            journal_entries.append(format_order_fill(order, fill_details))
 
             # Track position
             shares = fill_details['shares']
@@ -235,8 +306,7 @@ def main():
             threshold_temp = 80.0  # Default
             question = order.get('question', '')
             if "°F" in question or "degrees" in question:
-                import re
-                match = re.search(r'(\d+)°?F', question)
+                match = _THRESH_RE.search(question)
                 if match:
                     threshold_temp = float(match.group(1))
 
@@ -262,39 +332,44 @@ def main():
                 is_us_market=('noaa' in order.get('sources', [])),
                 forecast_sources=','.join(order.get('sources', []))
             )
+            # Persist FILLED before tracking the position, so a crash in
+            # between can't import the same fill again on the next run
+            save_order_updates(changed)
             tracker.add_position(position)
 
             print(f"  📊 Position tracked: {shares:.1f} shares @ {actual_price*100:.1f}¢")
             filled_count += 1
-
-            # Update trading state
-            current_balance = get_balance(client)
-            all_orders = load_open_orders()
-            all_positions = [vars(p) for p in tracker.get_active_positions()]
-            recent_activity = log_order_filled(order, fill_details)
-            write_trading_state(current_balance, all_orders, all_positions, recent_activity)
-            print(f"  📊 Trading state updated")
+            recent_activity = log_order_filled(order, fill_details, recent_activity)
             print()
 
         elif status == 'OPEN':
-            time_remaining = (ttl_expiry - now).total_seconds() / 60
+            time_remaining = (ttl_expiry - now_ts) / 60
             print(f"  ⏳ Still open (expires in {time_remaining:.0f} min)")
             still_open_count += 1
 
         elif status == 'NOT_FOUND':
             print(f"  ⚠️  Order not found (may have been cancelled)")
             # Mark as unknown
-            for o in all_orders:
-                if o['order_id'] == order_id:
-                    o['status'] = 'NOT_FOUND'
+            order['status'] = 'NOT_FOUND'
+            changed.append(order)
 
         else:
             print(f"  ℹ️  Status: {status}")
 
         print()
 
+    write_journal(journal_entries)
+
     # Save updated orders
-    save_open_orders(all_orders)
+    if changed:
+        all_orders = save_order_updates(changed)
+
+    # Update trading state once for all fills/cancellations
+    if recent_activity is not None:
+        current_balance = get_balance(client)
+        all_positions = [p.as_dict() for p in tracker.get_active_positions()]
+        write_trading_state(current_balance, all_orders, all_positions, recent_activity)
+        print(f"📊 Trading state updated")
 
     # Summary
     print("="*70)
@@ -15,11 +15,17 @@ from datetime import datetime
 from typing import Optional, Dict, List
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from py_clob_client.clob_types import MarketOrderArgs, OrderType
 from py_clob_client.order_builder.constants import SELL
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents an active trading position."""
     market_name: str
@@ -39,6 +45,10 @@ class Position:
     is_us_market: bool = True  # Whether US market
     forecast_sources: str = ""  # Comma-separated source list
 
+    def as_dict(self) -> dict:
+        """Shallow field -> value dict (all fields are scalars, so no asdict() deep copy)."""
+        return {f: getattr(self, f) for f in self.__slots__}
+
 
 @dataclass
 class ExitRecord:
@@ -71,14 +81,15 @@ class PositionTracker:
         """Load positions and exits from state file."""
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    data = orjson.loads(f.read()) if HAS_ORJSON else json.load(f)
 
                 for pos_dict in data.get('positions', []):
                     # Strip keys not in Position dataclass to avoid errors
                     valid = {k: v for k, v in pos_dict.items()
                              if k in Position.__dataclass_fields__}
                     pos = Position(**valid)
+                    pos.token_id = str(pos.token_id)  # Callers key price maps on it as-is
                     self.positions[pos.token_id] = pos
 
                 for exit_dict in data.get('exits', []):
@@ -97,19 +108,24 @@ class PositionTracker:
         existing = {}
         if self.state_file.exists():
             try:
-                with open(self.state_file) as f:
-                    existing = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    existing = orjson.loads(f.read()) if HAS_ORJSON else json.load(f)
             except Exception:
                 pass
 
-        existing['positions'] = [asdict(pos) for pos in self.positions.values()]
+        existing['positions'] = [pos.as_dict() for pos in self.positions.values()]
         existing['exits'] = [asdict(e) for e in self.exits]
         existing['last_updated'] = datetime.now().isoformat()
 
-        with open(self.state_file, 'w') as f:
-            json.dump(existing, f, indent=2)
+        if HAS_ORJSON:
+            with open(self.state_file, 'wb') as f:
+                f.write(orjson.dumps(existing, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.state_file, 'w') as f:
+                json.dump(existing, f, indent=2)
 
     def add_position(self, position: Position):
+        position.token_id = str(position.token_id)
         self.positions[position.token_id] = position
         self.save_state()
 
@@ -167,7 +167,7 @@ def compare_with_odds():
             continue
         
         city = parsed["city"].lower()
-        date_key = parsed["date"].strftime("%Y-%m-%d")
+        date_key = parsed["date_str"]
         
         # Get cached forecast
         city_forecasts = cache.get("forecasts", {}).get(city, {})
@@ -16,7 +16,12 @@ We only exit because our forecast data no longer supports the trade.
 Price is noise. Data is signal.
 """
 
+import atexit
 import json
+import os
+import queue
+import threading
+from collections import Counter
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
@@ -405,60 +410,138 @@ def monitor_all_positions(
             checks.append(check)
             monitor.record_check(check)
 
+    action_counts = Counter(c.action for c in checks)
     print(f"\n✅ Forecast monitoring complete")
-    print(f"   HOLD:       {sum(1 for c in checks if c.action == 'HOLD')}")
-    print(f"   EXIT:       {sum(1 for c in checks if c.action == 'EXIT')}")
-    print(f"   STRENGTHEN: {sum(1 for c in checks if c.action == 'STRENGTHEN')}")
+    print(f"   HOLD:       {action_counts['HOLD']}")
+    print(f"   EXIT:       {action_counts['EXIT']}")
+    print(f"   STRENGTHEN: {action_counts['STRENGTHEN']}")
 
     return checks
 
 
-def log_forecast_monitoring_to_journal(journal_file: Path, checks: List[ForecastCheck]):
+# Journal writes are handed to a background thread so the monitoring loop
+# never blocks on disk I/O. Items are (journal_file, pre-formatted block).
+_JOURNAL_QUEUE: "queue.Queue[Tuple[Path, str]]" = queue.Queue()
+_journal_thread: Optional[threading.Thread] = None
+_journal_thread_lock = threading.Lock()
+
+
+def _journal_writer_loop():
+    """Append queued journal blocks, keeping the current file handle open."""
+    handle = None
+    handle_path = None
+
+    while True:
+        journal_file, block = _JOURNAL_QUEUE.get()
+        try:
+            if handle_path != journal_file:
+                if handle:
+                    handle.close()
+                handle = open(journal_file, 'a')
+                handle_path = journal_file
+            handle.write(block)
+
+            # Drain whatever else is pending, then flush+fsync once
+            while True:
+                try:
+                    journal_file, block = _JOURNAL_QUEUE.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    if handle_path != journal_file:
+                        handle.flush()
+                        os.fsync(handle.fileno())
+                        handle.close()
+                        handle = open(journal_file, 'a')
+                        handle_path = journal_file
+                    handle.write(block)
+                finally:
+                    _JOURNAL_QUEUE.task_done()
+
+            handle.flush()
+            os.fsync(handle.fileno())
+        except Exception as e:
+            print(f"    ⚠️  Error writing forecast journal: {e}")
+            if handle:
+                handle.close()
+            handle = None
+            handle_path = None
+        finally:
+            _JOURNAL_QUEUE.task_done()
+
+
+def _ensure_journal_writer():
+    global _journal_thread
+    with _journal_thread_lock:
+        if _journal_thread is None or not _journal_thread.is_alive():
+            _journal_thread = threading.Thread(
+                target=_journal_writer_loop, name="forecast-journal", daemon=True
+            )
+            _journal_thread.start()
+
+
+def flush_journal():
+    """Block until every queued journal block has been written to disk."""
+    if _journal_thread is not None:
+        _JOURNAL_QUEUE.join()
+
+
+atexit.register(flush_journal)
+
+
+def format_forecast_monitoring_block(checks: List[ForecastCheck]) -> str:
     """
-    Log forecast monitoring results to daily journal per TRADING_RULES.md format.
+    Render forecast monitoring results in the TRADING_RULES.md journal format.
 
     ## Monitor — HH:MM:SS
     | Market | Entry | Current | P&L % | Edge | Action |
     """
-    if not checks:
-        return
+    lines = [
+        f"\n## Monitor — {datetime.now().strftime('%H:%M:%S')}\n\n",
+        "| Market | Entry | Current | P&L % | Edge | Action |\n",
+        "|--------|-------|---------|-------|------|--------|\n",
+    ]
+
+    for c in checks:
+        if c.entry_price > 0:
+            pnl_pct = (c.current_price / c.entry_price - 1) * 100
+        else:
+            pnl_pct = 0.0
+
+        lines.append(
+            f"| {c.market_name} | {c.entry_price * 100:.1f}¢ "
+            f"| {c.current_price * 100:.1f}¢ "
+            f"| {pnl_pct:+.1f}% "
+            f"| {c.current_edge:.1f}% "
+            f"| {c.action} |\n"
+        )
 
-    with open(journal_file, 'a') as f:
-        f.write(f"\n## Monitor — {datetime.now().strftime('%H:%M:%S')}\n\n")
-        f.write("| Market | Entry | Current | P&L % | Edge | Action |\n")
-        f.write("|--------|-------|---------|-------|------|--------|\n")
+    lines.append("\n")
 
-        for c in checks:
-            if c.entry_price > 0:
-                pnl_pct = (c.current_price / c.entry_price - 1) * 100
-            else:
-                pnl_pct = 0.0
-
-            action_str = {
-                "HOLD": "HOLD",
-                "EXIT": "EXIT",
-                "STRENGTHEN": "STRENGTHEN",
-            }.get(c.action, c.action)
-
-            f.write(
-                f"| {c.market_name} | {c.entry_price * 100:.1f}¢ "
-                f"| {c.current_price * 100:.1f}¢ "
-                f"| {pnl_pct:+.1f}% "
-                f"| {c.current_edge:.1f}% "
-                f"| {action_str} |\n"
-            )
+    exits = [c for c in checks if c.action == "EXIT"]
+    if exits:
+        lines.append("### Exits\n\n")
+        for c in exits:
+            lines.append(f"**{c.market_name}**\n")
+            lines.append(f"- {c.forecast_change_summary}\n")
+            if c.exit_executed:
+                lines.append(f"- Order: {c.exit_order_id}\n")
+                lines.append(f"- P&L: ${c.exit_pnl:+.2f}\n")
+            lines.append("\n")
+
+    lines.append("---\n\n")
+    return "".join(lines)
 
-        f.write("\n")
 
-        exits = [c for c in checks if c.action == "EXIT"]
-        if exits:
-            f.write("### Exits\n\n")
-            for c in exits:
-                f.write(f"**{c.market_name}**\n")
-                f.write(f"- {c.forecast_change_summary}\n")
-                if c.exit_executed:
-                    f.write(f"- Order: {c.exit_order_id}\n")
-                    f.write(f"- P&L: ${c.exit_pnl:+.2f}\n")
-                f.write("\n")
+def log_forecast_monitoring_to_journal(journal_file: Path, checks: List[ForecastCheck]):
+    """
+    Queue forecast monitoring results for the daily journal.
+
+    The block is formatted here and written by a background thread; call
+    flush_journal() when the write must be on disk before continuing.
+    """
+    if not checks:
+        return
 
-        f.write("---\n\n")
+    _ensure_journal_writer()
+    _JOURNAL_QUEUE.put((Path(journal_file), format_forecast_monitoring_block(checks)))
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Pooled HTTP helpers shared by the scanner scripts.
+
+Connections to Open-Meteo, NOAA, Gamma, Simmer etc. stay alive between
+calls instead of paying a TCP + TLS handshake each time. Backends, in order
+of preference:
+
+  httpx + h2   one HTTP/2 client; concurrent forecast calls to the same host
+               are multiplexed over a single connection
+  urllib3      one module-level PoolManager (HTTP/1.1 keep-alive)
+  neither      plain urllib.request.urlopen
+
+Errors are surfaced the same way in every mode: HTTP 4xx/5xx raise
+urllib.error.HTTPError, oversized bodies raise ValueError.
+
+JSON is encoded/decoded with orjson when it is installed (it parses the
+raw response bytes directly), otherwise with the stdlib json module.
+"""
+
+import json
+from urllib.error import HTTPError
+from urllib.request import urlopen, Request
+
+try:
+    import urllib3
+    HAS_URLLIB3 = True
+except ImportError:
+    HAS_URLLIB3 = False
+
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+    HAS_HTTPX_H2 = True
+except ImportError:
+    HAS_HTTPX_H2 = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+POOL_MAXSIZE = 50  # Enough for the forecast fan-out without "pool is full" warnings
+POOL_HOSTS = 32    # Distinct hosts kept warm (forecast providers, Gamma, Simmer, ...)
+
+_CLIENT = None
+_POOL = None
+if HAS_HTTPX_H2:
+    # Pool limits go on the transport: httpx ignores Client(limits=...) when
+    # a custom transport is given
+    _CLIENT = httpx.Client(
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_connections=POOL_MAXSIZE, max_keepalive_connections=POOL_HOSTS),
+        ),
+        follow_redirects=True,
+    )
+elif HAS_URLLIB3:
+    _POOL = urllib3.PoolManager(
+        num_pools=POOL_HOSTS,
+        maxsize=POOL_MAXSIZE,
+        retries=urllib3.Retry(3, backoff_factor=0.3, raise_on_status=False),
+    )
+
+
+def json_loads(data):
+    """Decode JSON from bytes or str."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """Encode obj as compact UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _read_body(resp, url, max_bytes):
+    if max_bytes is None:
+        return resp.read()
+    body = resp.read(max_bytes + 1)
+    if len(body) > max_bytes:
+        raise ValueError(f"response from {url} exceeds {max_bytes} bytes")
+    return body
+
+
+def http_request(method, url, headers=None, body=None, timeout=15, max_bytes=None, retries=None):
+    """
+    Send a request and return the raw response body as bytes.
+    
+    timeout may be a (connect, read) tuple so an unreachable host fails
+    fast without cutting off a slow response. retries overrides the pool's
+    default urllib3 Retry policy (ignored by the other backends; httpx only
+    ever retries failed connections).
+    """
+    if _CLIENT is not None:
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        with _CLIENT.stream(method, url, headers=headers, content=body, timeout=timeout) as resp:
+            if resp.status_code >= 400:
+                raise HTTPError(url, resp.status_code, resp.reason_phrase, resp.headers, None)
+            if max_bytes is None:
+                return resp.read()
+            chunks = []
+            size = 0
+            for chunk in resp.iter_bytes():
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ValueError(f"response from {url} exceeds {max_bytes} bytes")
+                chunks.append(chunk)
+            return b"".join(chunks)
+
+    if _POOL is not None:
+        if isinstance(timeout, tuple):
+            timeout = urllib3.Timeout(connect=timeout[0], read=timeout[1])
+        kwargs = {} if retries is None else {"retries": retries}
+        resp = _POOL.request(
+            method, url,
+            headers=headers,
+            body=body,
+            timeout=timeout,
+            preload_content=False,
+            **kwargs,
+        )
+        try:
+            if resp.status >= 400:
+                raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+            return _read_body(resp, url, max_bytes)
+        finally:
+            resp.release_conn()
+
+    if isinstance(timeout, tuple):
+        timeout = max(timeout)
+    req = Request(url, data=body, headers=headers or {}, method=method)
+    with urlopen(req, timeout=timeout) as resp:
+        return _read_body(resp, url, max_bytes)
+
+
+def http_json(method, url, headers=None, payload=None, timeout=15, max_bytes=None, retries=None):
+    """Send a request (JSON-encoding payload if given) and decode a JSON response."""
+    body = None
+    if payload is not None:
+        body = json_dumps(payload)
+        headers = {"Content-Type": "application/json", **(headers or {})}
+    return json_loads(http_request(method, url, headers, body, timeout, max_bytes, retries))
@@ -29,6 +29,12 @@ CLOB_API = "https://clob.polymarket.com"
 CRYPTO_KEYWORDS = ["btc", "bitcoin", "eth", "ethereum", "sol", "solana", "crypto", "doge", "xrp"]
 SHORT_DURATION_KEYWORDS = ["hour", "15 min", "minute", "daily", "today", "tonight", "midnight"]
 
+# Displayed prices can drift from the live book; only markets whose displayed
+# YES + NO is below 1.0 + this margin are worth an orderbook fetch.
+ORDERBOOK_PRICE_MARGIN = 0.02
+# Skip orderbook fetches for markets with less volume than this (USD)
+ORDERBOOK_MIN_VOLUME = 1000
+
 def fetch_json(url, timeout=15):
     """Fetch JSON from URL."""
     req = Request(url, headers={"User-Agent": "MicroArbScanner/1.0"})
@@ -69,7 +75,29 @@ def is_crypto_market(market, event):
     )
     return any(kw in text for kw in CRYPTO_KEYWORDS)
 
-def is_short_duration(market, event):
+def _parse_iso(date_str):
+    """Parse an ISO-8601 timestamp (with optional trailing Z), or None."""
+    if not date_str:
+        return None
+    try:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+def annotate_end_dates(events):
+    """
+    Parse endDate once per event/market and cache it under "_end_dt".
+    
+    Sibling markets without their own endDate reuse the event's parsed value.
+    """
+    for event in events:
+        event_end = _parse_iso(event.get("endDate"))
+        event["_end_dt"] = event_end
+        for market in event.get("markets", []):
+            end_date = market.get("endDate")
+            market["_end_dt"] = _parse_iso(end_date) if end_date else event_end
+
+def is_short_duration(market, event, now=None):
     """Check if market has short resolution time."""
     text = (
         market.get("question", "").lower() + " " +
@@ -81,23 +109,29 @@ def is_short_duration(market, event):
         return True
     
     # Check if end date is within 24 hours
-    end_date = market.get("endDate") or event.get("endDate")
-    if end_date:
+    if "_end_dt" in market:
+        end_dt = market["_end_dt"]
+    else:
+        end_dt = _parse_iso(market.get("endDate") or event.get("endDate"))
+    if end_dt:
         try:
-            end_dt = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-            now = datetime.now(timezone.utc)
+            now = now or datetime.now(timezone.utc)
             hours_until_end = (end_dt - now).total_seconds() / 3600
             if 0 < hours_until_end < 24:
                 return True
-        except:
+        except TypeError:
             pass
     
     return False
 
-def analyze_binary_market(market, check_orderbook=False):
+def analyze_binary_market(market, check_orderbook=False, always_check_orderbook=False):
     """
     Analyze binary market for YES + NO < 1.0 opportunities.
     
+    With check_orderbook, live prices are only fetched when the displayed sum
+    is within ORDERBOOK_PRICE_MARGIN of an arb and volume clears
+    ORDERBOOK_MIN_VOLUME, unless always_check_orderbook is set.
+    
     Returns opportunity dict if edge found, None otherwise.
     """
     try:
@@ -120,13 +154,20 @@ def analyze_binary_market(market, check_orderbook=False):
     
     # Calculate raw edge from displayed prices
     price_sum = yes_price + no_price
+    volume = float(market.get("volume", 0) or 0)
+    
+    if not always_check_orderbook:
+        if price_sum >= 1.0 + ORDERBOOK_PRICE_MARGIN:
+            return None  # Too far from an arb for live prices to matter
+        if check_orderbook and volume < ORDERBOOK_MIN_VOLUME:
+            check_orderbook = False
     
     # If we want to check real orderbook prices
     actual_yes_ask = yes_price
     actual_no_ask = no_price
     actual_sum = price_sum
     
-    if check_orderbook and len(token_ids) >= 2:
+    if (check_orderbook or always_check_orderbook) and len(token_ids) >= 2:
         yes_bid, yes_ask = get_live_prices(token_ids[0])
         no_bid, no_ask = get_live_prices(token_ids[1])
         
@@ -156,7 +197,7 @@ def analyze_binary_market(market, check_orderbook=False):
         "price_sum": actual_sum,
         "edge_pct": edge_pct,
         "roi_pct": roi_pct,
-        "volume": float(market.get("volume", 0) or 0),
+        "volume": volume,
         "liquidity": float(market.get("liquidity", 0) or 0),
         "token_ids": token_ids,
         "url": f"https://polymarket.com/event/{market.get('slug', '')}",
@@ -169,6 +210,9 @@ def scan_once(args):
         print("Failed to fetch events", file=sys.stderr)
         return []
     
+    annotate_end_dates(events)
+    now = datetime.now(timezone.utc)
+    
     opportunities = []
     scanned = 0
     
@@ -177,16 +221,25 @@ def scan_once(args):
             # Apply filters
             if args.crypto_only and not is_crypto_market(market, event):
                 continue
-            if args.short_only and not is_short_duration(market, event):
-                continue
+            is_short = None
+            if args.short_only:
+                is_short = is_short_duration(market, event, now)
+                if not is_short:
+                    continue
             
             scanned += 1
-            opp = analyze_binary_market(market, check_orderbook=args.check_orderbook)
+            opp = analyze_binary_market(
+                market,
+                check_orderbook=args.check_orderbook,
+                always_check_orderbook=args.always_check_orderbook,
+            )
             
             if opp and opp["edge_pct"] >= args.min_edge:
                 opp["event_title"] = event.get("title", "")
                 opp["is_crypto"] = is_crypto_market(market, event)
-                opp["is_short"] = is_short_duration(market, event)
+                if is_short is None:
+                    is_short = is_short_duration(market, event, now)
+                opp["is_short"] = is_short
                 opportunities.append(opp)
     
     # Sort by edge
@@ -234,6 +287,9 @@ def main():
                        help="Only scan short-duration markets")
     parser.add_argument("--check-orderbook", action="store_true",
                        help="Check live orderbook prices (slower but accurate)")
+    parser.add_argument("--always-check-orderbook", action="store_true",
+                       help="Fetch the orderbook for every binary market, even when "
+                            "displayed prices rule out an arb")
     parser.add_argument("--watch", action="store_true",
                        help="Continuous monitoring mode")
     parser.add_argument("--interval", type=int, default=30,
@@ -246,7 +302,7 @@ def main():
     
     print("🔍 Polymarket Micro-Arbitrage Scanner")
     print(f"   Min edge: {args.min_edge}% | Crypto only: {args.crypto_only} | Short only: {args.short_only}")
-    print(f"   Check orderbook: {args.check_orderbook}")
+    print(f"   Check orderbook: {args.check_orderbook or args.always_check_orderbook}")
     
     if args.watch:
         print(f"   Mode: Continuous (every {args.interval}s)")
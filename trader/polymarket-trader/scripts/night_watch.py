@@ -6,26 +6,65 @@ Scans weather markets and executes trades on good opportunities.
 Designed to run via cron every 30 minutes.
 """
 
+import heapq
 import json
 import os
 import sys
 import re
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-import urllib.request
 import urllib.error
 
+from http_pool import HAS_ORJSON, HAS_URLLIB3, http_json, json_loads
+
+if HAS_ORJSON:
+    import orjson
+
+if HAS_URLLIB3:
+    import urllib3
+from ttl_cache import ttl_cache
+
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 CONFIG_FILE = SCRIPT_DIR.parent / "config/simmer_config.json"
 STATE_FILE = SCRIPT_DIR.parent / "config/trading_state.json"
 JOURNAL_DIR = SCRIPT_DIR.parent / "journal"
 
+# Simmer SDK endpoints
+SIMMER_MARKETS_URL = "https://api.simmer.markets/api/sdk/markets?tags=weather&limit=100"
+SIMMER_TRADE_URL = "https://api.simmer.markets/api/sdk/trade"
+
 # Config
 MIN_EDGE = 10.0  # Minimum edge percentage to trade
 MAX_BET = 10.0   # $10 per trade
 MAX_TRADES_PER_RUN = 2  # Max trades per cron run
 MAX_DAILY_TRADES = 6    # Max trades per day
+FORECAST_WORKERS = 8    # Concurrent forecast fetches
+FORECAST_TTL = 900      # Seconds to reuse a cached forecast across runs
+MAX_RESPONSE_BYTES = 256 * 1024  # Reject oversized forecast payloads
+TRADE_TIMEOUT = (5, 25)  # (connect, read) seconds: give up fast if Simmer is unreachable
+TRADE_CONNECT_RETRIES = 2  # Only connection failures are retried; a sent trade never is
+IN_RANGE_PROB = 0.75    # Our probability when the forecast lands in the range
+# Out-of-range probability by distance (°F) from the nearest edge of the
+# range: <=2 -> 25%, <=4 -> 10%, further -> 3%
+_MISS_DISTANCES = (2, 4, float("inf"))
+_MISS_PROBS = (0.25, 0.10, 0.03)
+# Above this price even an in-range forecast can't reach MIN_EDGE
+MAX_ENTRY_PROB = IN_RANGE_PROB - MIN_EDGE / 100
 
 CITY_COORDS = {
     "new york city": (40.7128, -74.0060),
@@ -35,6 +74,44 @@ CITY_COORDS = {
     "dallas": (32.7767, -96.7970),
     "seattle": (47.6062, -122.3321),
 }
+# Interned keys: cities returned by the matchers below are the same objects,
+# so CITY_COORDS lookups hit on identity before comparing strings
+CITY_COORDS = {sys.intern(city): coords for city, coords in CITY_COORDS.items()}
+_CITY_ITEMS = tuple(CITY_COORDS.items())
+
+# Market question patterns, compiled once at import
+_CITY_RE = re.compile(r'\b(' + '|'.join(re.escape(c) for c, _ in _CITY_ITEMS) + r')\b')
+_TEMP_RE = re.compile(
+    r'(?P<between>between\s+(\d+)-(\d+)\s*°)'
+    r'|(?P<higher>(\d+)\s*°[fF]?\s+or\s+higher)'
+    r'|(?P<lower>(\d+)\s*°[fF]?\s+or\s+(?:lower|below))'
+)
+# The outer named group that matched is m.lastgroup; map it to a temp range
+_TEMP_RANGE = {
+    "between": lambda m: (int(m.group(2)), int(m.group(3))),
+    "higher": lambda m: (int(m.group(5)), 150),
+    "lower": lambda m: (-50, int(m.group(7))),
+}
+_DATE_RE = re.compile(r'february\s+(\d+)')
+
+# With pyahocorasick installed, cities are found in one pass over the question
+_CITY_AUTOMATON = None
+if HAS_AHOCORASICK:
+    _CITY_AUTOMATON = ahocorasick.Automaton()
+    for _city, _ in _CITY_ITEMS:
+        _CITY_AUTOMATON.add_word(_city, _city)
+    _CITY_AUTOMATON.make_automaton()
+
+# With google-re2 installed, one linear-time SET pass tells us which of the
+# patterns above occur, so questions missing a city or temp form are rejected
+# without running any backtracking regex.
+_SET_CITY, _SET_TEMP, _SET_DATE = 0, 1, 2
+_QUESTION_SET = None
+if HAS_RE2:
+    _QUESTION_SET = re2.Set.SearchSet()
+    for _pattern in (_CITY_RE, _TEMP_RE, _DATE_RE):
+        _QUESTION_SET.Add(_pattern.pattern)
+    _QUESTION_SET.Compile()
 
 
 def load_config():
@@ -44,23 +121,37 @@ def load_config():
 
 def load_state():
     if STATE_FILE.exists():
-        with open(STATE_FILE) as f:
-            return json.load(f)
+        with open(STATE_FILE, "rb") as f:
+            return json_loads(f.read())
     return {"daily_trades": 0, "last_reset": "", "traded_markets": []}
 
 
 def save_state(state):
     STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    if HAS_ORJSON:
+        with open(STATE_FILE, "wb") as f:
+            f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+        return
     with open(STATE_FILE, "w") as f:
         json.dump(state, f, indent=2)
 
 
-def log_to_journal(trade_info):
-    """Append trade to daily journal."""
+def open_journal(today):
+    """Open today's journal for appending, writing the header if it's new."""
     JOURNAL_DIR.mkdir(parents=True, exist_ok=True)
-    today = datetime.utcnow().strftime("%Y-%m-%d")
-    journal_file = JOURNAL_DIR / f"{today}.md"
+    fh = open(JOURNAL_DIR / f"{today}.md", "a")
+    if fh.tell() == 0:
+        fh.write(f"# Trade Journal - {today}\n\n## Trades\n")
+    return fh
+
+
+def log_to_journal(trade_info, fh=None, today=None):
+    """
+    Append trade to daily journal, via fh if the caller holds it open.
     
+    today ("YYYY-MM-DD") names the file when no handle is passed; it
+    defaults to the current UTC date.
+    """
     entry = f"""
 ### Trade @ {trade_info['timestamp']}
 - **Market:** {trade_info['question']}
@@ -74,35 +165,36 @@ def log_to_journal(trade_info):
 
 """
     
-    if not journal_file.exists():
-        header = f"# Trade Journal - {today}\n\n## Trades\n"
-        with open(journal_file, "w") as f:
-            f.write(header)
+    if fh is not None:
+        fh.write(entry)
+        return
     
-    with open(journal_file, "a") as f:
-        f.write(entry)
+    if today is None:
+        today = datetime.utcnow().strftime("%Y-%m-%d")
+    with open_journal(today) as fh:
+        fh.write(entry)
 
 
-def fetch_json(url, headers=None, timeout=45):
-    """Fetch JSON from URL."""
-    req = urllib.request.Request(url, headers=headers or {})
+def fetch_json(url, headers=None, timeout=45, max_bytes=None):
+    """Fetch JSON from URL, optionally refusing bodies over max_bytes."""
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode())
+        return http_json("GET", url, headers=headers, timeout=timeout, max_bytes=max_bytes)
     except Exception as e:
         print(f"   Error fetching {url}: {e}")
         return None
 
 
-def get_forecast(city, date):
-    """Get temperature forecast for city on date."""
+def forecast_url(city, date):
+    """Open-Meteo daily-high URL for a known city, or None."""
     if city not in CITY_COORDS:
         return None
     
     lat, lon = CITY_COORDS[city]
-    url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&daily=temperature_2m_max&timezone=auto&start_date={date}&end_date={date}&temperature_unit=fahrenheit"
-    
-    data = fetch_json(url)
+    return f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&daily=temperature_2m_max&timezone=auto&start_date={date}&end_date={date}&temperature_unit=fahrenheit"
+
+
+def extract_forecast_temp(data):
+    """Pull the daily high (°F) out of an Open-Meteo response."""
     if data and "daily" in data:
         temps = data["daily"].get("temperature_2m_max", [])
         if temps:
@@ -110,41 +202,87 @@ def get_forecast(city, date):
     return None
 
 
-def parse_market(market):
-    """Parse weather market to extract city and temp range."""
+def batch_open_meteo(coords, date):
+    """
+    Fetch the daily high for several (lat, lon) points in one Open-Meteo call.
+    
+    Returns {(lat, lon): payload} for the points that came back.
+    """
+    coords = list(coords)
+    if not coords:
+        return {}
+    
+    lat_str = ",".join(f"{lat:.4f}" for lat, _ in coords)
+    lon_str = ",".join(f"{lon:.4f}" for _, lon in coords)
+    url = f"https://api.open-meteo.com/v1/forecast?latitude={lat_str}&longitude={lon_str}&daily=temperature_2m_max&timezone=auto&start_date={date}&end_date={date}&temperature_unit=fahrenheit"
+    
+    data = fetch_json(url, max_bytes=MAX_RESPONSE_BYTES * len(coords))
+    if data is None:
+        return {}
+    # A single location comes back as an object, several as a list in request order
+    if isinstance(data, dict):
+        data = [data]
+    return dict(zip(coords, data))
+
+
+@ttl_cache("night_watch", seconds=FORECAST_TTL)
+def get_forecast(city, date):
+    """
+    Get temperature forecast for city on date.
+    
+    ttl_cache serves repeat lookups from memory and carries results across
+    runs; failed fetches (None) are not cached, so they retry next call.
+    """
+    url = forecast_url(city, date)
+    if not url:
+        return None
+    
+    return extract_forecast_temp(fetch_json(url, max_bytes=MAX_RESPONSE_BYTES))
+
+
+def parse_market(market, today=None):
+    """
+    Parse weather market to extract city and temp range.
+    
+    Questions without a date fall back to today ("YYYY-MM-DD", default
+    current UTC date).
+    """
     question = market.get("question", "").lower()
     
+    hits = None
+    if _QUESTION_SET is not None:
+        hits = _QUESTION_SET.Match(question) or ()  # Match() returns None, not [], on no match
+        if _SET_CITY not in hits or _SET_TEMP not in hits:
+            return None
+    
     # Find city
     city = None
-    for c in CITY_COORDS.keys():
-        if c in question:
-            city = c
+    if _CITY_AUTOMATON is not None:
+        for _, city in _CITY_AUTOMATON.iter(question):
             break
-    
+    else:
+        city_match = _CITY_RE.search(question)
+        if city_match:
+            city = sys.intern(city_match.group(1))
     if not city:
         return None
     
     # Find temp range
-    range_match = re.search(r'between\s+(\d+)-(\d+)\s*°', question)
-    higher_match = re.search(r'(\d+)\s*°[fF]?\s+or\s+higher', question)
-    lower_match = re.search(r'(\d+)\s*°[fF]?\s+or\s+(lower|below)', question)
-    
-    if range_match:
-        temp_range = (int(range_match.group(1)), int(range_match.group(2)))
-    elif higher_match:
-        temp_range = (int(higher_match.group(1)), 150)
-    elif lower_match:
-        temp_range = (-50, int(lower_match.group(1)))
-    else:
+    temp_match = _TEMP_RE.search(question)
+    if not temp_match:
         return None
     
+    temp_range = _TEMP_RANGE[temp_match.lastgroup](temp_match)
+    
     # Find date
-    date_match = re.search(r'february\s+(\d+)', question)
+    date_match = None
+    if hits is None or _SET_DATE in hits:
+        date_match = _DATE_RE.search(question)
     if date_match:
         day = int(date_match.group(1))
         date = f"2026-02-{day:02d}"
     else:
-        date = datetime.utcnow().strftime("%Y-%m-%d")
+        date = today or datetime.utcnow().strftime("%Y-%m-%d")
     
     return {
         "city": city,
@@ -153,31 +291,76 @@ def parse_market(market):
     }
 
 
-def analyze_opportunity(market):
-    """Analyze market for trading opportunity."""
-    parsed = parse_market(market)
-    if not parsed:
+def fetch_forecasts(keys):
+    """
+    Fetch forecasts for a set of (city, date) keys.
+    
+    Cities sharing a date go out as one batched Open-Meteo request; anything
+    the batch didn't return is retried per city, concurrently.
+    
+    Returns {(city, date): temp or None}.
+    """
+    results = {}
+    by_date = {}
+    for city, date in keys:
+        cached = get_forecast.lookup(city, date)
+        if cached is not None:
+            results[(city, date)] = cached
+        elif city in CITY_COORDS:
+            by_date.setdefault(date, []).append(city)
+        else:
+            results[(city, date)] = None
+    
+    missing = []
+    for date, cities in by_date.items():
+        payloads = batch_open_meteo([CITY_COORDS[c] for c in cities], date)
+        for city in cities:
+            temp = extract_forecast_temp(payloads.get(CITY_COORDS[city]))
+            if temp is None:
+                missing.append((city, date))
+            else:
+                get_forecast.store(temp, city, date)
+                results[(city, date)] = temp
+    
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(FORECAST_WORKERS, len(missing))) as pool:
+            results.update(zip(missing, pool.map(lambda key: get_forecast(*key), missing)))
+    return results
+
+
+def parse_and_prefilter(market, today=None):
+    """
+    Cheap, I/O-free checks for a market.
+    
+    Returns the parsed market (with market_prob) or None if the question
+    can't be parsed or the price is too high for any forecast to give
+    MIN_EDGE.
+    """
+    market_prob = market.get("current_probability", 0)
+    if market_prob > MAX_ENTRY_PROB:
         return None
     
-    # Get forecast
-    forecast_temp = get_forecast(parsed["city"], parsed["date"])
-    if forecast_temp is None:
+    parsed = parse_market(market, today)
+    if not parsed:
         return None
     
+    parsed["market"] = market
+    parsed["market_prob"] = market_prob
+    return parsed
+
+
+def score_with_forecast(parsed, forecast_temp):
+    """Score a prefiltered market against its forecast high."""
+    market = parsed["market"]
     temp_low, temp_high = parsed["temp_range"]
-    market_prob = market.get("current_probability", 0)
+    market_prob = parsed["market_prob"]
     
     # Calculate our probability estimate
     if temp_low <= forecast_temp <= temp_high:
-        our_prob = 0.75  # In range = high confidence
+        our_prob = IN_RANGE_PROB  # In range = high confidence
     else:
         distance = min(abs(forecast_temp - temp_low), abs(forecast_temp - temp_high))
-        if distance <= 2:
-            our_prob = 0.25
-        elif distance <= 4:
-            our_prob = 0.10
-        else:
-            our_prob = 0.03
+        our_prob = _MISS_PROBS[bisect_left(_MISS_DISTANCES, distance)]
     
     edge = (our_prob - market_prob) * 100
     
@@ -195,127 +378,207 @@ def analyze_opportunity(market):
     }
 
 
-def execute_trade(api_key, opportunity):
-    """Execute trade on Simmer."""
-    url = "https://api.simmer.markets/api/sdk/trade"
+def analyze_opportunity(market, forecast_cache=None):
+    """
+    Analyze market for trading opportunity.
+    
+    forecast_cache maps (city, date) to a prefetched forecast temp; keys
+    missing from it are fetched on demand.
+    """
+    parsed = parse_and_prefilter(market)
+    if not parsed:
+        return None
+    
+    # Get forecast
+    key = (parsed["city"], parsed["date"])
+    if forecast_cache is not None and key in forecast_cache:
+        forecast_temp = forecast_cache[key]
+    else:
+        forecast_temp = get_forecast(*key)
+    if forecast_temp is None:
+        return None
     
+    return score_with_forecast(parsed, forecast_temp)
+
+
+def best_first(opportunities):
+    """
+    Yield opportunities highest edge first.
+    
+    Only a couple of trades are placed per run, so pop lazily from a heap
+    (O(N + k log N)) instead of sorting the whole list. Failed trades still
+    fall through to the next-best opportunity. Ties keep their input order.
+    """
+    heap = [(-opp["edge"], i, opp) for i, opp in enumerate(opportunities)]
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap)[2]
+
+
+def build_trade_payload(opportunity):
+    """Simmer SDK trade request body for an opportunity."""
     reasoning = f"Forecast: {opportunity['forecast_temp']}°F. Range {opportunity['temp_range'][0]}-{opportunity['temp_range'][1]}°F. Edge: {opportunity['edge']:.1f}%"
     
-    data = json.dumps({
+    return {
         "market_id": opportunity["market_id"],
         "side": "yes",
         "amount": MAX_BET,
         "venue": "simmer",
         "reasoning": reasoning,
         "source": "sdk:night-watch",
-    }).encode()
+    }
+
+
+def build_journal_entry(opp, result, timestamp):
+    """Journal record for a filled trade."""
+    return {
+        "timestamp": timestamp,
+        "question": opp["question"],
+        "cost": result.get("cost", 0),
+        "shares": result.get("shares_bought", 0),
+        "entry_price": opp["market_prob"],
+        "forecast_temp": opp["forecast_temp"],
+        "edge": opp["edge"],
+        "reasoning": f"Forecast {opp['forecast_temp']}°F in {opp['temp_range'][0]}-{opp['temp_range'][1]}°F range",
+    }
+
+
+def execute_trade(api_key, opportunity):
+    """Execute trade on Simmer."""
+    url = SIMMER_TRADE_URL
+    payload = build_trade_payload(opportunity)
     
-    req = urllib.request.Request(url, data=data, headers={
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    })
+    retries = None
+    if HAS_URLLIB3:
+        retries = urllib3.Retry(
+            total=TRADE_CONNECT_RETRIES, connect=TRADE_CONNECT_RETRIES,
+            read=0, status=0, backoff_factor=0.3, raise_on_status=False,
+        )
     
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
+        return http_json("POST", url, headers={
+            "Authorization": f"Bearer {api_key}",
+        }, payload=payload, timeout=TRADE_TIMEOUT, retries=retries)
     except urllib.error.HTTPError as e:
         return {"success": False, "error": f"HTTP {e.code}"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
-def main():
-    now = datetime.utcnow()
-    print(f"🌙 Night Watch — {now.strftime('%Y-%m-%d %H:%M:%S')} UTC")
-    
-    # Load config
-    config = load_config()
-    api_key = config.get("api_key")
-    
-    if not api_key:
-        print("❌ No API key found")
-        return
+def run_cycle(api_key, state):
+    """
+    One Night Watch pass: scan, score and trade. Mutates state in place.
+
+    Shared by main() (one cron run) and night_watch_daemon.py (one cycle of
+    the long-running loop). Returns True if state changed and should be saved.
+    """
+    # One clock read per cycle; every date/timestamp below derives from it
+    now_str = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    today = now_str[:10]
+    print(f"🌙 Night Watch — {now_str} UTC")
     
-    # Load state
-    state = load_state()
-    today = now.strftime("%Y-%m-%d")
+    changed = False
     
     # Reset daily counter if new day
     if state.get("last_reset") != today:
         state["daily_trades"] = 0
         state["traded_markets"] = []
         state["last_reset"] = today
-        save_state(state)
+        changed = True
     
     # Check daily limit
     if state["daily_trades"] >= MAX_DAILY_TRADES:
         print(f"   Daily limit reached ({MAX_DAILY_TRADES} trades). Skipping.")
-        return
+        return changed
     
     # Fetch weather markets
     print("   Fetching weather markets...")
-    markets_url = "https://api.simmer.markets/api/sdk/markets?tags=weather&limit=100"
-    markets_data = fetch_json(markets_url, {"Authorization": f"Bearer {api_key}"})
+    markets_data = fetch_json(SIMMER_MARKETS_URL, {"Authorization": f"Bearer {api_key}"})
     
     if not markets_data:
         print("   ❌ Failed to fetch markets")
-        return
+        return changed
     
     markets = markets_data.get("markets", [])
     print(f"   Found {len(markets)} weather markets")
     
+    # Filter to untraded active markets
+    traded = set(state.get("traded_markets", []))
+    candidates = [
+        m for m in markets
+        if m.get("status") == "active" and m["id"] not in traded
+    ]
+    
+    # Parse and prefilter before any forecast I/O
+    parsed_markets = [p for p in (parse_and_prefilter(m, today) for m in candidates) if p]
+    
+    # Fetch each (city, date) forecast once, batched per date
+    forecast_cache = fetch_forecasts({(p["city"], p["date"]) for p in parsed_markets})
+    
     # Analyze opportunities
     opportunities = []
-    for market in markets:
-        if market.get("status") != "active":
+    for parsed in parsed_markets:
+        forecast_temp = forecast_cache.get((parsed["city"], parsed["date"]))
+        if forecast_temp is None:
             continue
-        if market["id"] in state.get("traded_markets", []):
-            continue  # Already traded this market
-        
-        opp = analyze_opportunity(market)
-        if opp and opp["edge"] >= MIN_EDGE:
+        opp = score_with_forecast(parsed, forecast_temp)
+        if opp["edge"] >= MIN_EDGE:
             opportunities.append(opp)
     
-    opportunities.sort(key=lambda x: x["edge"], reverse=True)
     print(f"   Found {len(opportunities)} opportunities ≥{MIN_EDGE}% edge")
     
     # Execute trades
     trades_made = 0
-    for opp in opportunities:
-        if trades_made >= MAX_TRADES_PER_RUN:
-            break
-        if state["daily_trades"] >= MAX_DAILY_TRADES:
-            break
-        
-        print(f"\n   🎯 {opp['city']} {opp['temp_range'][0]}-{opp['temp_range'][1]}°F")
-        print(f"      Market: {opp['market_prob']*100:.1f}% | Forecast: {opp['forecast_temp']}°F | Edge: {opp['edge']:.1f}%")
-        
-        result = execute_trade(api_key, opp)
-        
-        if result.get("success"):
-            trades_made += 1
-            state["daily_trades"] += 1
-            state["traded_markets"].append(opp["market_id"])
+    journal = None  # Opened on the first fill, closed once the cycle is done
+    try:
+        for opp in best_first(opportunities):
+            if trades_made >= MAX_TRADES_PER_RUN:
+                break
+            if state["daily_trades"] >= MAX_DAILY_TRADES:
+                break
             
-            print(f"      ✅ Bought {result.get('shares_bought', 0):.2f} shares for ${result.get('cost', 0):.2f}")
-            print(f"      💰 Balance: ${result.get('balance', 0):.2f} $SIM")
+            print(f"\n   🎯 {opp['city']} {opp['temp_range'][0]}-{opp['temp_range'][1]}°F")
+            print(f"      Market: {opp['market_prob']*100:.1f}% | Forecast: {opp['forecast_temp']}°F | Edge: {opp['edge']:.1f}%")
             
-            # Log to journal
-            log_to_journal({
-                "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
-                "question": opp["question"],
-                "cost": result.get("cost", 0),
-                "shares": result.get("shares_bought", 0),
-                "entry_price": opp["market_prob"],
-                "forecast_temp": opp["forecast_temp"],
-                "edge": opp["edge"],
-                "reasoning": f"Forecast {opp['forecast_temp']}°F in {opp['temp_range'][0]}-{opp['temp_range'][1]}°F range",
-            })
-        else:
-            print(f"      ❌ Failed: {result.get('error', 'Unknown')}")
+            result = execute_trade(api_key, opp)
+            
+            if result.get("success"):
+                trades_made += 1
+                state["daily_trades"] += 1
+                state["traded_markets"].append(opp["market_id"])
+                changed = True
+                
+                print(f"      ✅ Bought {result.get('shares_bought', 0):.2f} shares for ${result.get('cost', 0):.2f}")
+                print(f"      💰 Balance: ${result.get('balance', 0):.2f} $SIM")
+                
+                # Log to journal
+                if journal is None:
+                    journal = open_journal(today)
+                log_to_journal(build_journal_entry(opp, result, now_str), journal)
+            else:
+                print(f"      ❌ Failed: {result.get('error', 'Unknown')}")
+    finally:
+        if journal is not None:
+            journal.close()
     
-    save_state(state)
     print(f"\n   Done. Trades today: {state['daily_trades']}/{MAX_DAILY_TRADES}")
+    return changed
+
+
+def main():
+    # Load config
+    config = load_config()
+    api_key = config.get("api_key")
+    
+    if not api_key:
+        print("❌ No API key found")
+        return
+    
+    # Load state
+    state = load_state()
+    
+    if run_cycle(api_key, state):
+        save_state(state)
 
 
 if __name__ == "__main__":
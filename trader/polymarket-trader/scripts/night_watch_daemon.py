@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Night Watch Daemon - long-running version of night_watch.py.
+
+Instead of cron starting a fresh process every 30 minutes, this keeps one
+process alive so http_pool's pooled connections and the in-memory forecast
+cache carry over between cycles. Each cycle is night_watch.run_cycle(), the
+same pass a cron run makes.
+
+Usage:
+  python3 night_watch_daemon.py                 # Run forever (every 30 min)
+  python3 night_watch_daemon.py --once          # Single cycle, then exit
+  python3 night_watch_daemon.py --interval 900  # Custom cycle length
+"""
+
+import argparse
+import signal
+import sys
+import time
+
+from night_watch import load_config, load_state, run_cycle, save_state
+from ttl_cache import save_cache
+
+CYCLE_SECONDS = 1800  # Matches the old 30-minute cron schedule
+
+
+def run(interval, once=False):
+    config = load_config()
+    api_key = config.get("api_key")
+    if not api_key:
+        print("❌ No API key found")
+        return
+
+    state = load_state()
+
+    while True:
+        try:
+            if run_cycle(api_key, state):
+                save_state(state)
+        except Exception as e:
+            print(f"   ❌ Cycle failed: {e}")
+        # Don't rely on atexit alone: a crash or SIGKILL would drop the cycle's forecasts
+        save_cache()
+
+        if once:
+            break
+        time.sleep(interval)
+
+
+def _exit_on_sigterm(signum, frame):
+    # systemd stops the unit with SIGTERM, whose default action skips atexit
+    sys.exit(0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Night Watch as a long-running daemon")
+    parser.add_argument("--interval", type=int, default=CYCLE_SECONDS,
+                        help=f"Seconds between cycles (default: {CYCLE_SECONDS})")
+    parser.add_argument("--once", action="store_true", help="Run a single cycle and exit")
+    args = parser.parse_args()
+
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    try:
+        run(args.interval, once=args.once)
+    except KeyboardInterrupt:
+        print("\n   Night Watch stopped.")
+
+
+if __name__ == "__main__":
+    main()
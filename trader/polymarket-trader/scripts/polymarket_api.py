@@ -15,16 +15,36 @@ Usage:
 
 import os
 import json
+import fcntl
+import functools
+import hashlib
+import time
 from decimal import Decimal
 from pathlib import Path
 from typing import Optional, Literal
+from urllib.parse import urlsplit
 
 from dotenv import load_dotenv
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import ApiCreds, OrderArgs, OrderType
 from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.http_helpers import helpers as clob_http
 from eth_account import Account
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+    HAS_HTTPX_H2 = True
+except ImportError:
+    HAS_HTTPX_H2 = False
+
 # Polymarket credentials loaded from ~/.tinyclaw/polymarket.env (not .env — daemon.sh wipes .env on restart)
 load_dotenv(os.path.expanduser("~/.tinyclaw/polymarket.env"))
 
@@ -32,6 +52,25 @@ load_dotenv(os.path.expanduser("~/.tinyclaw/polymarket.env"))
 CLOB_HOST = "https://clob.polymarket.com"
 CHAIN_ID = 137  # Polygon mainnet
 
+# Pooled HTTP for py-clob-client (keep-alive, HTTP/2 when available)
+CLOB_TIMEOUT = 5
+CLOB_POOL_CONNECTIONS = 4
+CLOB_POOL_MAXSIZE = 16
+
+# Token buckets shared by every process on the host (monitors, trader, tests).
+# Polymarket allows 3000 /order calls per 10 min; stay well under that per endpoint class.
+RATE_LIMIT_FILE = Path.home() / ".tinyclaw" / "ratelimit.json"
+RATE_CAPACITY = 50        # Burst size per bucket
+RATE_REFILL_PER_SEC = 5   # Sustained calls/second per bucket
+CLOB_MAX_RETRIES = 3      # Retries on 429 (and 5xx for GETs), with exponential backoff
+CLOB_BACKOFF = 0.5        # Seconds, doubled per attempt
+
+FIRST_MARKETS_CURSOR = "MA=="
+
+# Derived L2 API credentials, reused across processes (delete the file to force re-derivation)
+CREDS_CACHE_FILE = Path.home() / ".tinyclaw" / "polymarket.apikey.json"
+CREDS_CACHE_MAX_AGE = 30 * 24 * 3600
+
 # Config
 SCRIPT_DIR = Path(__file__).parent
 CONFIG_DIR = SCRIPT_DIR.parent / "config"
@@ -53,10 +92,179 @@ def load_trading_limits():
     
     return defaults
 
+def _rate_bucket(url: str) -> str:
+    """Map a CLOB URL to its endpoint class: order, balance or markets."""
+    path = urlsplit(url).path
+    if path.startswith(("/order", "/cancel")):
+        return "order"
+    if path.startswith("/balance"):
+        return "balance"
+    return "markets"
+
+def _take_token(bucket: str) -> float:
+    """Take a token from the shared bucket; returns seconds to wait if it was empty."""
+    RATE_LIMIT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(RATE_LIMIT_FILE, "a+") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)  # Released when the file is closed
+        f.seek(0)
+        try:
+            state = json.loads(f.read() or "{}")
+        except ValueError:
+            state = {}
+
+        now = time.time()
+        tokens, ts = state.get(bucket, (RATE_CAPACITY, now))
+        tokens = min(RATE_CAPACITY, tokens + (now - ts) * RATE_REFILL_PER_SEC)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / RATE_REFILL_PER_SEC
+        state[bucket] = (tokens, now)
+
+        f.seek(0)
+        f.truncate()
+        f.write(json.dumps(state))
+    return wait
+
+def acquire_token(bucket: str):
+    """Block until the shared rate limit allows one more call in this bucket."""
+    while True:
+        wait = _take_token(bucket)
+        if wait <= 0:
+            return
+        time.sleep(wait)
+
+def _retry_delay(resp, attempt: int) -> float:
+    try:
+        return float(resp.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return CLOB_BACKOFF * 2 ** attempt
+
+class _PooledRequests:
+    """
+    Stand-in for the requests module inside py_clob_client.http_helpers.
+
+    Older py-clob-client releases call requests.request() for every API call,
+    which opens a new connection and TLS handshake each time. Routing those
+    calls through one pooled client keeps the connection alive between calls,
+    and every call first takes a token from the shared rate limit (see
+    acquire_token). With httpx + h2 installed that client speaks HTTP/2, so
+    concurrent CLOB calls share a single multiplexed connection. Transport
+    errors are re-raised as requests.RequestException so the helper's own
+    error handling still applies; everything else still comes from requests.
+    """
+
+    # requests.JSONDecodeError subclasses this, so catching it covers both backends
+    JSONDecodeError = json.JSONDecodeError
+
+    def __init__(self, session):
+        self.session = session
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", CLOB_TIMEOUT)
+        bucket = _rate_bucket(url)
+        for attempt in range(CLOB_MAX_RETRIES + 1):
+            acquire_token(bucket)
+            resp = self._send(method, url, **kwargs)
+            # 5xx on a POST/DELETE may have been applied; only retry those on 429
+            retryable = resp.status_code == 429 or (resp.status_code >= 500 and method == "GET")
+            if not retryable or attempt == CLOB_MAX_RETRIES:
+                return resp
+            time.sleep(_retry_delay(resp, attempt))
+
+    def _send(self, method, url, **kwargs):
+        if not HAS_HTTPX_H2:
+            return self.session.request(method, url, **kwargs)
+        try:
+            return self.session.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            raise requests.RequestException(str(e)) from e
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+SESSION = None
+if HAS_REQUESTS and getattr(clob_http, "requests", None) is requests:
+    if HAS_HTTPX_H2:
+        SESSION = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=CLOB_POOL_MAXSIZE,
+                                max_keepalive_connections=CLOB_POOL_CONNECTIONS),
+        )
+    else:
+        SESSION = requests.Session()
+        SESSION.mount("https://", HTTPAdapter(pool_connections=CLOB_POOL_CONNECTIONS,
+                                              pool_maxsize=CLOB_POOL_MAXSIZE))
+    clob_http.requests = _PooledRequests(SESSION)
+
+def pace_clob_call(bucket: str):
+    """
+    Rate-limit a CLOB call made through the client. A no-op when the pooled
+    shim is installed (it already takes a token per request); otherwise
+    takes one from the shared bucket directly.
+    """
+    if SESSION is None:
+        acquire_token(bucket)
+
+def _creds_cache_key(address: str) -> str:
+    return hashlib.sha256(address.lower().encode()).hexdigest()
+
+def load_cached_creds(address: str) -> Optional[ApiCreds]:
+    """Return cached API credentials for the signer address, if fresh."""
+    try:
+        with open(CREDS_CACHE_FILE) as f:
+            entry = json.load(f).get(_creds_cache_key(address))
+    except (OSError, ValueError):
+        return None
+    if not entry or time.time() - entry.get("ts", 0) > CREDS_CACHE_MAX_AGE:
+        return None
+    return ApiCreds(
+        api_key=entry["api_key"],
+        api_secret=entry["api_secret"],
+        api_passphrase=entry["api_passphrase"]
+    )
+
+def save_cached_creds(address: str, creds: ApiCreds):
+    """Cache API credentials for the signer address (file mode 0600)."""
+    try:
+        with open(CREDS_CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    cache[_creds_cache_key(address)] = {
+        "api_key": creds.api_key,
+        "api_secret": creds.api_secret,
+        "api_passphrase": creds.api_passphrase,
+        "ts": int(time.time()),
+    }
+    try:
+        CREDS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CREDS_CACHE_FILE.with_suffix(".json.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp, CREDS_CACHE_FILE)
+    except OSError as e:
+        print(f"⚠️  Could not cache API credentials: {e}")
+
+@functools.lru_cache(maxsize=1)
+def ecc_backend_name() -> str:
+    """Name of the secp256k1 backend eth_keys resolved (CoinCurveECCBackend is the C one)."""
+    try:
+        from eth_keys.backends import get_backend
+        return type(get_backend()).__name__
+    except Exception:
+        return "unknown"
+
+_CLIENTS = {}  # signature_type -> authenticated ClobClient, built once per process
+
 def get_client(signature_type: int = 1) -> ClobClient:
     """
     Get authenticated Polymarket CLOB client.
 
+    The client is built once per signature type and reused by later calls.
+
     Uses POLYMARKET_PRIVATE_KEY environment variable for the Magic.link signer key,
     and POLYMARKET_ADDRESS for the proxy wallet address (from your profile page).
 
@@ -64,6 +272,10 @@ def get_client(signature_type: int = 1) -> ClobClient:
         signature_type: 0=EOA (standalone wallet), 1=POLY_PROXY (Polymarket account via email/Google),
                         2=GNOSIS_SAFE (browser wallet). Default 1 for Polymarket.com accounts.
     """
+    client = _CLIENTS.get(signature_type)
+    if client is not None:
+        return client
+
     key = os.environ.get("POLYMARKET_PRIVATE_KEY")
     if not key:
         raise ValueError("POLYMARKET_PRIVATE_KEY environment variable not set")
@@ -76,6 +288,10 @@ def get_client(signature_type: int = 1) -> ClobClient:
             "NOT the address derived from your private key."
         )
 
+    # Signing and key derivation are 10-100x slower on the pure-Python backend
+    if ecc_backend_name() == "NativeECCBackend":
+        print("⚠️  eth_keys is using pure-Python secp256k1; pip install coincurve for C-speed signing")
+
     client = ClobClient(
         host=CLOB_HOST,
         chain_id=CHAIN_ID,
@@ -84,16 +300,23 @@ def get_client(signature_type: int = 1) -> ClobClient:
         funder=funder  # Polymarket proxy wallet address (from profile page)
     )
     
-    # Derive and set API credentials
-    creds = client.create_or_derive_api_creds()
-    client.set_api_creds(ApiCreds(
-        api_key=creds.api_key,
-        api_secret=creds.api_secret,
-        api_passphrase=creds.api_passphrase
-    ))
+    # Reuse cached API credentials; derive (signed round-trip) only on a miss
+    signer = client.get_address()
+    creds = load_cached_creds(signer)
+    if creds is None:
+        derived = client.create_or_derive_api_creds()
+        creds = ApiCreds(
+            api_key=derived.api_key,
+            api_secret=derived.api_secret,
+            api_passphrase=derived.api_passphrase
+        )
+        save_cached_creds(signer, creds)
+    client.set_api_creds(creds)
     
+    _CLIENTS[signature_type] = client
     return client
 
+@functools.lru_cache(maxsize=1)
 def get_wallet_address() -> str:
     """Get Polymarket proxy wallet address (the one that holds balances/positions)."""
     addr = os.environ.get("POLYMARKET_ADDRESS")
@@ -172,6 +395,14 @@ def get_positions(client: ClobClient) -> list:
         print(f"Error fetching positions: {e}")
         return []
 
+def get_markets_page(next_cursor: str) -> dict:
+    """
+    One page of the CLOB market listing ({"data": [...], "next_cursor": ...}).
+
+    The listing is a public endpoint, so this uses a keyless client.
+    """
+    return ClobClient(CLOB_HOST, chain_id=CHAIN_ID).get_markets(next_cursor=next_cursor)
+
 def get_market_info(client: ClobClient, condition_id: str) -> Optional[dict]:
     """Get market info by condition ID."""
     try:
@@ -326,7 +557,7 @@ if __name__ == "__main__":
         
         if args.test or (not args.balance and not args.orders):
             print("\n🧪 Testing API...")
-            markets = client.get_markets()
+            markets = get_markets_page(FIRST_MARKETS_CURSOR).get("data")
             print(f"   Markets accessible: {len(markets) if markets else 'unknown'}")
             print("   ✅ API fully operational")
             
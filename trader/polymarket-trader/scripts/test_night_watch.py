@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Tests for night_watch.parse_market's google-re2 prefilter.
+
+re2 need not be installed: a stub stands in for the compiled re2.Set.
+
+    python3 -m unittest test_night_watch
+"""
+
+import unittest
+from unittest import mock
+
+import night_watch
+
+
+class StubSet:
+    """re2.Set stand-in: Match() returns the given hits, or None like re2 on no match."""
+
+    def __init__(self, hits):
+        self.hits = hits
+
+    def Match(self, text):
+        return self.hits
+
+
+class ParseMarketRe2Test(unittest.TestCase):
+    def test_non_matching_question_is_rejected(self):
+        with mock.patch.object(night_watch, "_QUESTION_SET", StubSet(None)):
+            self.assertIsNone(night_watch.parse_market({"question": "Will it rain in Paris?"}))
+
+    def test_missing_temp_pattern_is_rejected(self):
+        hits = [night_watch._SET_CITY]
+        with mock.patch.object(night_watch, "_QUESTION_SET", StubSet(hits)):
+            self.assertIsNone(night_watch.parse_market({"question": "Will Chicago see snow?"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+On-disk TTL cache for forecast API results.
+
+Forecasts only change a few times a day, but the cron-driven scanners re-hit
+the same endpoints every run. Results are kept in memory during a run and
+persisted to config/forecast_cache/_cache.json on exit so the next run can
+skip the network while entries are still fresh. Expired entries are dropped
+and the cache is capped at MAX_ENTRIES (oldest evicted first), so it stays
+bounded in long-running processes like night_watch_daemon.py.
+
+Usage:
+  from ttl_cache import ttl_cache
+
+  @ttl_cache("open_meteo", seconds=900)
+  def get_forecast_open_meteo(lat, lon, date):
+      ...
+"""
+
+import atexit
+import functools
+import json
+import threading
+import time
+from datetime import date as date_type, datetime
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+CACHE_DIR = SCRIPT_DIR.parent / "config" / "forecast_cache"
+CACHE_FILE = CACHE_DIR / "_cache.json"
+
+MAX_ENTRIES = 2048  # Oldest entries are evicted past this, so long-running processes stay bounded
+
+_entries = None  # key -> {"ts": float, "ttl": float, "payload": ...}, oldest first
+_dirty = False
+_lock = threading.Lock()
+
+
+def _fresh(entry, now):
+    return now - entry.get("ts", 0) < entry.get("ttl", 0)
+
+
+def _read_file():
+    """Unexpired entries currently on disk, oldest first."""
+    try:
+        with open(CACHE_FILE) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    now = time.time()
+    fresh = [(k, v) for k, v in data.items() if isinstance(v, dict) and _fresh(v, now)]
+    return dict(sorted(fresh, key=lambda kv: kv[1].get("ts", 0)))
+
+
+def _load():
+    global _entries
+    if _entries is None:
+        _entries = _read_file()
+    return _entries
+
+
+def _prune(entries):
+    """Drop expired entries, then the oldest ones past MAX_ENTRIES."""
+    now = time.time()
+    for key in [k for k, v in entries.items() if not _fresh(v, now)]:
+        del entries[key]
+    while len(entries) > MAX_ENTRIES:
+        del entries[next(iter(entries))]
+
+
+def save_cache():
+    """
+    Persist unexpired entries to disk if anything changed this run.
+
+    Other scanners may have saved since this process loaded the file, so their
+    entries are merged in (newest wins per key) rather than overwritten.
+    """
+    global _dirty
+    with _lock:
+        if not _dirty or _entries is None:
+            return
+        _prune(_entries)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            merged = _read_file()
+            for key, entry in _entries.items():
+                if entry["ts"] >= merged.get(key, {}).get("ts", 0):
+                    merged[key] = entry
+            merged = dict(sorted(merged.items(), key=lambda kv: kv[1].get("ts", 0)))
+            _prune(merged)
+            tmp = CACHE_FILE.with_suffix(".json.tmp")
+            with open(tmp, "w") as f:
+                json.dump(merged, f)
+            tmp.replace(CACHE_FILE)
+            _dirty = False
+        except OSError as e:
+            print(f"   ⚠️  Could not save forecast cache: {e}")
+
+
+atexit.register(save_cache)
+
+
+def _key_part(value):
+    if isinstance(value, float):
+        return f"{value:.4f}"
+    if isinstance(value, (datetime, date_type)):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+
+def make_key(source, *args):
+    """Build a cache key like 'open_meteo:40.7128:-74.0060:2026-02-15'."""
+    return ":".join([source] + [_key_part(a) for a in args])
+
+
+def ttl_cache(source, seconds):
+    """
+    Cache a function's JSON-serializable result for `seconds`.
+
+    Keyed by source name plus positional args. None results are not cached
+    so failed fetches are retried on the next call. The wrapper also exposes
+    lookup(*args) and store(result, *args) for callers that fetch in bulk.
+    """
+    def decorator(func):
+        def lookup(*args):
+            """Return the fresh cached result for args, or None."""
+            with _lock:
+                entry = _load().get(make_key(source, *args))
+                if entry and time.time() - entry["ts"] < seconds:
+                    return entry["payload"]
+            return None
+
+        def store(result, *args):
+            """Cache a result fetched outside the wrapped function (e.g. in a batch)."""
+            global _dirty
+            if result is None:
+                return
+            with _lock:
+                entries = _load()
+                key = make_key(source, *args)
+                entries.pop(key, None)  # Re-insert at the end so dict order stays oldest-first
+                entries[key] = {"ts": time.time(), "ttl": seconds, "payload": result}
+                if len(entries) > MAX_ENTRIES:
+                    _prune(entries)
+                _dirty = True
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            cached = lookup(*args)
+            if cached is not None:
+                return cached
+
+            result = func(*args)
+            store(result, *args)
+            return result
+
+        wrapper.lookup = lookup
+        wrapper.store = store
+        return wrapper
+    return decorator
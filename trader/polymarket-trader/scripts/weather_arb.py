@@ -18,27 +18,82 @@ Usage:
 """
 
 import argparse
+import asyncio
+import io
 import json
 import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
 import statistics
 
+from http_pool import http_json, http_request
+from ttl_cache import ttl_cache
+
 try:
     import geohash2
     HAS_GEOHASH2 = True
 except ImportError:
     HAS_GEOHASH2 = False
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 GAMMA_API = "https://gamma-api.polymarket.com"
 OPEN_METEO_API = "https://api.open-meteo.com/v1/forecast"
 VISUAL_CROSSING_API = "https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline"
 NOAA_API = "https://api.weather.gov"
 
+# Cross-run forecast cache lifetimes (seconds)
+FORECAST_TTL = 900
+NOAA_TTL = 3600
+# Forecast payloads are small; anything bigger than this is rejected
+MAX_FORECAST_BYTES = 256 * 1024
+
+# In-process memo of combined ensembles (provider results are also disk-cached)
+ENSEMBLE_TTL = 900
+ENSEMBLE_MAXSIZE = 256
+_ENSEMBLE_CACHE = {}  # (lat, lon, date, is_us, local_source, city_name) -> (ts, result), oldest first
+_ENSEMBLE_LOCK = threading.Lock()
+
+# Filtered Gamma event list, reused briefly across callers in one process
+EVENTS_TTL = 60
+_EVENTS_CACHE = {}  # (days_ahead, first_date, last_date) -> (ts, events)
+_EVENTS_LOCK = threading.Lock()
+
+# Events analyzed concurrently per scan, and the provider pool sized so each
+# in-flight event can run its global pair + one local source at once
+EVENT_CONCURRENCY = 8
+FORECAST_WORKERS = 3 * EVENT_CONCURRENCY
+_FORECAST_POOL = ThreadPoolExecutor(max_workers=FORECAST_WORKERS, thread_name_prefix="forecast")
+
+# In-flight request caps for the rate-limited global providers, so a wide
+# scan doesn't trip Open-Meteo / Visual Crossing throttling
+OPEN_METEO_CONCURRENCY = 4
+VISUAL_CROSSING_CONCURRENCY = 2
+_OPEN_METEO_SLOTS = threading.BoundedSemaphore(OPEN_METEO_CONCURRENCY)
+_VISUAL_CROSSING_SLOTS = threading.BoundedSemaphore(VISUAL_CROSSING_CONCURRENCY)
+
 # Config file path
 SCRIPT_DIR = Path(__file__).parent
 CONFIG_PATH = SCRIPT_DIR.parent / "config" / "weather_api.json"
@@ -68,6 +123,47 @@ WEATHER_CITIES = [
     ("dallas",          32.7767,  -96.7970, True,  "noaa"),
 ]
 
+# Exact-name index; most titles use the canonical city name
+CITY_INDEX = {entry[0]: entry for entry in WEATHER_CITIES}
+
+# Aho-Corasick automaton over WEATHER_CITIES names; each match carries the
+# full city tuple so one scan of a title yields coords and sources.
+_CITY_AUTOMATON = None
+if HAS_AHOCORASICK:
+    _CITY_AUTOMATON = ahocorasick.Automaton()
+    for _entry in WEATHER_CITIES:
+        _CITY_AUTOMATON.add_word(_entry[0], _entry)
+    _CITY_AUTOMATON.make_automaton()
+
+
+def lookup_city(city_name):
+    """Return the WEATHER_CITIES tuple matching a parsed city name, or None."""
+    entry = CITY_INDEX.get(city_name)
+    if entry is not None:
+        return entry
+
+    # Fuzzy fallback: the title name contains, or is contained in, a known city
+    if _CITY_AUTOMATON is not None:
+        for _, entry in _CITY_AUTOMATON.iter(city_name):
+            return entry
+
+    for entry in WEATHER_CITIES:
+        c_name = entry[0]
+        if c_name in city_name or city_name in c_name:
+            return entry
+    return None
+
+
+# Market title / question patterns, compiled once at import
+# Title: "Highest temperature in Seoul on February 10?"
+_CITY_TITLE_RE = re.compile(r'highest temperature in ([a-z\s]+) on')
+MONTHS = {'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+          'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12}
+_DATE_TITLE_RE = re.compile(r'on (' + '|'.join(MONTHS) + r')\s+(\d+)')
+# Question: "be -1°C or below", "be 0°C on", "be 5°C or higher"
+_TEMP_RE = re.compile(r'be\s+(-?\d+)°')
+
+
 def load_config():
     """Load API configuration."""
     if CONFIG_PATH.exists():
@@ -81,27 +177,19 @@ def load_config():
 
 CONFIG = load_config()
 
-def fetch_json(url, timeout=15):
-    """Fetch JSON from URL."""
+def fetch_json(url, timeout=15, max_bytes=None):
+    """Fetch JSON from URL, optionally refusing bodies over max_bytes."""
     default_headers = {"User-Agent": "WeatherArb/1.0 (Polymarket trading bot)"}
-    req = Request(url, headers=default_headers)
     try:
-        with urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode())
-    except HTTPError as e:
-        if e.code == 503:
-            return None
-        return None
-    except Exception as e:
+        return http_json("GET", url, headers=default_headers, timeout=timeout, max_bytes=max_bytes)
+    except Exception:
         return None
 
 
 def fetch_json_with_headers(url, headers, timeout=15):
     """Fetch JSON from URL with custom headers."""
-    req = Request(url, headers=headers)
     try:
-        with urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode())
+        return http_json("GET", url, headers=headers, timeout=timeout)
     except Exception:
         return None
 
@@ -110,12 +198,14 @@ def fetch_json_with_headers(url, headers, timeout=15):
 # Weather API Implementations
 # ============================================================================
 
+@ttl_cache("open_meteo", seconds=FORECAST_TTL)
 def get_forecast_open_meteo(lat, lon, date):
     """Get forecast from Open-Meteo (free, global)."""
     date_str = date.strftime("%Y-%m-%d")
     url = f"{OPEN_METEO_API}?latitude={lat}&longitude={lon}&daily=temperature_2m_max,temperature_2m_min&timezone=auto&start_date={date_str}&end_date={date_str}"
     
-    data = fetch_json(url)
+    with _OPEN_METEO_SLOTS:
+        data = fetch_json(url, max_bytes=MAX_FORECAST_BYTES)
     if not data or "daily" not in data:
         return None
     
@@ -132,6 +222,7 @@ def get_forecast_open_meteo(lat, lon, date):
         }
     return None
 
+@ttl_cache("visual_crossing", seconds=FORECAST_TTL)
 def get_forecast_visual_crossing(lat, lon, date):
     """Get forecast from Visual Crossing (high accuracy)."""
     api_key = CONFIG.get("visual_crossing_api_key")
@@ -141,7 +232,8 @@ def get_forecast_visual_crossing(lat, lon, date):
     date_str = date.strftime("%Y-%m-%d")
     url = f"{VISUAL_CROSSING_API}/{lat},{lon}/{date_str}?unitGroup=metric&key={api_key}&include=days"
     
-    data = fetch_json(url)
+    with _VISUAL_CROSSING_SLOTS:
+        data = fetch_json(url, max_bytes=MAX_FORECAST_BYTES)
     if not data or "days" not in data or not data["days"]:
         return None
     
@@ -159,10 +251,17 @@ def get_forecast_visual_crossing(lat, lon, date):
         }
     return None
 
+def _period_temp_f(period):
+    """NOAA forecast period temperature in °F."""
+    temp = period["temperature"]
+    return temp if period.get("temperatureUnit", "F") == "F" else temp * 9/5 + 32
+
+
+@ttl_cache("noaa", seconds=NOAA_TTL)
 def get_forecast_noaa(lat, lon, date):
     """Get forecast from NOAA/weather.gov (US only, gold standard)."""
     points_url = f"{NOAA_API}/points/{lat},{lon}"
-    points_data = fetch_json(points_url)
+    points_data = fetch_json(points_url, max_bytes=MAX_FORECAST_BYTES)
     
     if not points_data or "properties" not in points_data:
         return None
@@ -171,7 +270,7 @@ def get_forecast_noaa(lat, lon, date):
     if not forecast_url:
         return None
     
-    forecast_data = fetch_json(forecast_url)
+    forecast_data = fetch_json(forecast_url, max_bytes=MAX_FORECAST_BYTES)
     if not forecast_data or "properties" not in forecast_data:
         return None
     
@@ -180,24 +279,13 @@ def get_forecast_noaa(lat, lon, date):
         return None
     
     target_date = date.strftime("%Y-%m-%d")
-    highs = []
-    lows = []
-    
-    for period in periods:
-        start_time = period.get("startTime", "")
-        if target_date not in start_time:
-            continue
-        
-        temp = period.get("temperature")
-        unit = period.get("temperatureUnit", "F")
-        is_daytime = period.get("isDaytime", True)
-        
-        if temp is not None:
-            temp_f = temp if unit == "F" else temp * 9/5 + 32
-            if is_daytime:
-                highs.append(temp_f)
-            else:
-                lows.append(temp_f)
+    # startTime is ISO-8601, so the date is always the first 10 chars
+    day_periods = [
+        p for p in periods
+        if p.get("startTime", "")[:10] == target_date and p.get("temperature") is not None
+    ]
+    highs = [_period_temp_f(p) for p in day_periods if p.get("isDaytime", True)]
+    lows = [_period_temp_f(p) for p in day_periods if not p.get("isDaytime", True)]
     
     if not highs and not lows:
         temp = periods[0].get("temperature")
@@ -216,11 +304,14 @@ def get_forecast_noaa(lat, lon, date):
             }
         return None
     
-    high_f = max(highs) if highs else (max(lows) + 10 if lows else None)
-    low_f = min(lows) if lows else (min(highs) - 10 if highs else None)
-    
-    if high_f is None or low_f is None:
-        return None
+    if HAS_NUMPY:
+        highs = np.fromiter(highs, dtype=float, count=len(highs))
+        lows = np.fromiter(lows, dtype=float, count=len(lows))
+        high_f = float(highs.max()) if highs.size else float(lows.max()) + 10
+        low_f = float(lows.min()) if lows.size else float(highs.min()) - 10
+    else:
+        high_f = max(highs) if highs else max(lows) + 10
+        low_f = min(lows) if lows else min(highs) - 10
     
     return {
         "source": "noaa",
@@ -230,6 +321,7 @@ def get_forecast_noaa(lat, lon, date):
         "low_c": (low_f - 32) * 5/9,
     }
 
+@ttl_cache("metservice", seconds=FORECAST_TTL)
 def get_forecast_metservice(city_name, date):
     """Get forecast from MetService (NZ national service). Returns °C."""
     METSERVICE_CITIES = {
@@ -267,6 +359,7 @@ def get_forecast_metservice(city_name, date):
     return None
 
 
+@ttl_cache("bom", seconds=FORECAST_TTL)
 def get_forecast_bom(lat, lon, date):
     """Get forecast from BOM (Australian Bureau of Meteorology). Returns °C."""
     if not HAS_GEOHASH2:
@@ -301,6 +394,7 @@ def get_forecast_bom(lat, lon, date):
 
 
 
+@ttl_cache("kma", seconds=FORECAST_TTL)
 def get_forecast_kma(lat, lon, date):
     """
     Get forecast from KMA (Korea Meteorological Administration) KIM 8km model.
@@ -336,9 +430,9 @@ def get_forecast_kma(lat, lon, date):
             f"&tmfc={tmfc}&hf={hf}&disp=A&lat={lat}&lon={lon}&authKey={auth_key}"
         )
         try:
-            req = Request(url, headers={"User-Agent": "WeatherArb/1.0"})
-            with urlopen(req, timeout=10) as resp:
-                raw = resp.read().decode("utf-8", errors="replace")
+            raw = http_request(
+                "GET", url, headers={"User-Agent": "WeatherArb/1.0"}, timeout=10
+            ).decode("utf-8", errors="replace")
             for line in raw.splitlines():
                 line = line.strip()
                 if line.startswith("#") or not line:
@@ -374,10 +468,71 @@ def get_forecast_kma(lat, lon, date):
 # Ensemble Forecasting
 # ============================================================================
 
+def _combine_forecasts(forecasts, weights, total_weight):
+    """
+    Weighted high/low means and high spread across forecast sources.
+
+    Returns (weighted_high_c, weighted_low_c or None, high_spread_c). Lows are
+    summed over sources that report one, normalised by total_weight.
+    """
+    if HAS_NUMPY:
+        # One (n, 3) array of high, low (NaN if missing), weight per source
+        table = np.array([
+            (f["high_c"],
+             f["low_c"] if f.get("low_c") is not None else np.nan,
+             weights.get(f["source"], 1))
+            for f in forecasts
+        ], dtype=float)
+        highs, lows, ws = table.T
+
+        weighted_high_c = float(np.dot(highs, ws)) / total_weight
+        has_low = ~np.isnan(lows)
+        weighted_low_c = float(np.dot(lows[has_low], ws[has_low])) / total_weight if has_low.any() else None
+        high_spread = float(np.ptp(highs))
+        return weighted_high_c, weighted_low_c, high_spread
+
+    high_c_values = [f["high_c"] for f in forecasts]
+    weighted_high_c = sum(f["high_c"] * weights.get(f["source"], 1) for f in forecasts) / total_weight
+    with_low = [f for f in forecasts if f.get("low_c") is not None]
+    weighted_low_c = None
+    if with_low:
+        weighted_low_c = sum(f["low_c"] * weights.get(f["source"], 1) for f in with_low) / total_weight
+    high_spread = max(high_c_values) - min(high_c_values)
+    return weighted_high_c, weighted_low_c, high_spread
+
+
 def get_ensemble_forecast(lat, lon, date, is_us=False, local_source=None, city_name=None):
     """
     Get ensemble forecast from all available sources.
 
+    Results are memoized for ENSEMBLE_TTL seconds per location/date (at most
+    ENSEMBLE_MAXSIZE entries), so events and monitor passes sharing a city
+    reuse one ensemble. See
+    _build_ensemble_forecast for weighting.
+    """
+    key = (round(lat, 3), round(lon, 3), date.strftime("%Y-%m-%d"), is_us, local_source, city_name)
+    now = time.time()
+    with _ENSEMBLE_LOCK:
+        cached = _ENSEMBLE_CACHE.get(key)
+        if cached and now - cached[0] < ENSEMBLE_TTL:
+            return cached[1]
+
+    result = _build_ensemble_forecast(lat, lon, date, is_us, local_source, city_name)
+    if result is not None:
+        with _ENSEMBLE_LOCK:
+            _ENSEMBLE_CACHE.pop(key, None)  # Re-insert at the end to keep oldest-first order
+            _ENSEMBLE_CACHE[key] = (now, result)
+            for stale in [k for k, (ts, _) in _ENSEMBLE_CACHE.items() if now - ts >= ENSEMBLE_TTL]:
+                del _ENSEMBLE_CACHE[stale]
+            while len(_ENSEMBLE_CACHE) > ENSEMBLE_MAXSIZE:
+                del _ENSEMBLE_CACHE[next(iter(_ENSEMBLE_CACHE))]
+    return result
+
+
+def _build_ensemble_forecast(lat, lon, date, is_us=False, local_source=None, city_name=None):
+    """
+    Fetch and combine forecasts from all available sources.
+
     Weighting per TRADING_RULES.md:
       US markets:              noaa=40%, visual_crossing=35%, open_meteo=25%
       Non-US with local:       local_national=50%, open_meteo=25%, visual_crossing=25%
@@ -386,34 +541,23 @@ def get_ensemble_forecast(lat, lon, date, is_us=False, local_source=None, city_n
     Disagreement flag: if local source disagrees with global average by >2°C,
     confidence is capped at 0.50 (effectively blocks trade at 80% threshold).
     """
-    global_forecasts = []
-    local_forecast = None
-
-    om = get_forecast_open_meteo(lat, lon, date)
-    if om:
-        global_forecasts.append(om)
-
-    vc = get_forecast_visual_crossing(lat, lon, date)
-    if vc:
-        global_forecasts.append(vc)
+    # Fire all providers at once; wall time is the slowest call, not the sum
+    om_future = _FORECAST_POOL.submit(get_forecast_open_meteo, lat, lon, date)
+    vc_future = _FORECAST_POOL.submit(get_forecast_visual_crossing, lat, lon, date)
 
     # Fetch local national source
+    local_future = None
     if is_us:
-        noaa = get_forecast_noaa(lat, lon, date)
-        if noaa:
-            local_forecast = noaa
+        local_future = _FORECAST_POOL.submit(get_forecast_noaa, lat, lon, date)
     elif local_source == "metservice" and city_name:
-        ms = get_forecast_metservice(city_name, date)
-        if ms:
-            local_forecast = ms
+        local_future = _FORECAST_POOL.submit(get_forecast_metservice, city_name, date)
     elif local_source == "bom":
-        bom = get_forecast_bom(lat, lon, date)
-        if bom:
-            local_forecast = bom
+        local_future = _FORECAST_POOL.submit(get_forecast_bom, lat, lon, date)
     elif local_source == "kma":
-        kma = get_forecast_kma(lat, lon, date)
-        if kma:
-            local_forecast = kma
+        local_future = _FORECAST_POOL.submit(get_forecast_kma, lat, lon, date)
+
+    global_forecasts = [f for f in (om_future.result(), vc_future.result()) if f]
+    local_forecast = local_future.result() if local_future else None
 
     all_forecasts = global_forecasts + ([local_forecast] if local_forecast else [])
 
@@ -448,20 +592,13 @@ def get_ensemble_forecast(lat, lon, date, is_us=False, local_source=None, city_n
         for f in all_forecasts:
             w[f["source"]] = 1
 
-    high_c_values = [f["high_c"] for f in all_forecasts]
-    low_c_values = [f["low_c"] for f in all_forecasts if f.get("low_c") is not None]
-
-    weighted_high_c = sum(f["high_c"] * w.get(f["source"], 1) for f in all_forecasts) / total_weight
-    if low_c_values:
-        weighted_low_c = sum(
-            f["low_c"] * w.get(f["source"], 1)
-            for f in all_forecasts if f.get("low_c") is not None
-        ) / total_weight
-    else:
+    weighted_high_c, weighted_low_c, high_spread = _combine_forecasts(
+        all_forecasts, w, total_weight
+    )
+    if weighted_low_c is None:
         weighted_low_c = weighted_high_c - 10  # fallback estimate
 
     if len(all_forecasts) >= 2:
-        high_spread = max(high_c_values) - min(high_c_values)
         confidence = max(0.3, min(0.95, 1.0 - (high_spread - 1) / 8))
         if len(all_forecasts) == 3 and high_spread <= 2:
             confidence = min(0.98, confidence + 0.1)
@@ -523,10 +660,10 @@ def prepare_forecasts_for_market(forecasts, is_us_market):
 # Polymarket Weather Market Discovery
 # ============================================================================
 
-def generate_weather_slugs(days_ahead=3):
-    """Generate potential weather market slugs for upcoming days."""
+def generate_weather_slugs(days_ahead=3, now=None):
+    """Generate potential weather market slugs for upcoming days (from now, default current time)."""
     slugs = []
-    today = datetime.now()
+    today = now or datetime.now()
     
     for days in range(0, days_ahead + 1):
         target_date = today + timedelta(days=days)
@@ -558,14 +695,43 @@ def fetch_weather_event(slug):
         return events[0]
     return None
 
-def get_weather_events(days_ahead=3):
-    """Get all available weather events from the weather tag."""
+def get_weather_events(days_ahead=3, now=None):
+    """
+    Get all available weather events from the weather tag.
+
+    Target dates are resolved relative to now (default: current time); pass
+    the scan cycle's timestamp so every date check in a cycle agrees.
+    Results are reused for EVENTS_TTL seconds per resolved date window, so
+    scanners and monitors running in one process share a single Gamma fetch.
+    """
+    today = now or datetime.now()
+    key = (days_ahead,) + _event_date_window(days_ahead, today)
+    fetched_at = time.time()
+    with _EVENTS_LOCK:
+        cached = _EVENTS_CACHE.get(key)
+        if cached and fetched_at - cached[0] < EVENTS_TTL:
+            return list(cached[1])
+
+    weather_events = _fetch_weather_events(days_ahead, today)
+    if weather_events:
+        with _EVENTS_LOCK:
+            _EVENTS_CACHE[key] = (fetched_at, weather_events)
+    return list(weather_events)
+
+def _event_date_window(days_ahead, today):
+    """First and last target dates _fetch_weather_events keeps for today."""
+    tick = timedelta(microseconds=1)
+    first = (today - timedelta(days=1) - tick).date() + timedelta(days=1)
+    last = (today + timedelta(days=days_ahead + 1) - tick).date()
+    return first, last
+
+def _fetch_weather_events(days_ahead, today):
+    """Fetch and filter weather events from Gamma (uncached)."""
     # Much faster: use tag_slug=weather endpoint
     url = f"{GAMMA_API}/events?tag_slug=weather&closed=false&limit=100"
     events = fetch_json(url) or []
     
     weather_events = []
-    today = datetime.now()
     
     for event in events:
         title = event.get("title", "").lower()
@@ -576,9 +742,8 @@ def get_weather_events(days_ahead=3):
         
         # Extract city and date from title
         # Pattern: "Highest temperature in Seoul on February 10?"
-        import re
-        city_match = re.search(r'highest temperature in ([a-z\s]+) on', title)
-        date_match = re.search(r'on (january|february|march|april|may|june|july|august|september|october|november|december)\s+(\d+)', title)
+        city_match = _CITY_TITLE_RE.search(title)
+        date_match = _DATE_TITLE_RE.search(title)
         
         if not city_match or not date_match:
             continue
@@ -589,23 +754,22 @@ def get_weather_events(days_ahead=3):
         
         # Find city coordinates
         city_info = None
-        for c_name, lat, lon, is_us, local_source in WEATHER_CITIES:
-            if c_name in city_name or city_name in c_name:
-                city_info = {"city": c_name.title(), "lat": lat, "lon": lon, "is_us": is_us, "local_source": local_source}
-                break
+        entry = lookup_city(city_name)
+        if entry:
+            c_name, lat, lon, is_us, local_source = entry
+            city_info = {"city": c_name.title(), "lat": lat, "lon": lon, "is_us": is_us, "local_source": local_source}
         
         if not city_info:
             # Try to add unknown city with approximate coords
             city_info = {"city": city_name.title(), "lat": 0, "lon": 0, "is_us": False, "local_source": None}
         
         # Parse date
-        months = {'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
-                  'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12}
+        month = MONTHS[month_name]
         year = today.year
         try:
-            target_date = datetime(year, months[month_name], day)
+            target_date = datetime(year, month, day)
             if target_date < today - timedelta(days=1):
-                target_date = datetime(year + 1, months[month_name], day)
+                target_date = datetime(year + 1, month, day)
         except ValueError:
             continue
         
@@ -614,11 +778,34 @@ def get_weather_events(days_ahead=3):
             continue
         
         city_info["date"] = target_date
+        city_info["date_str"] = target_date.strftime("%Y-%m-%d")
         event["_city_info"] = city_info
         weather_events.append(event)
     
     return weather_events
 
+def _parse_prices(raw):
+    """
+    (yes, no) prices from Gamma's outcomePrices, e.g. '["0.73", "0.27"]'.
+
+    The usual two-price string is split directly; an already-decoded list is
+    used as is and anything else goes through json.loads. Missing or
+    malformed prices come back as None.
+    """
+    try:
+        yes, no = raw[1:-1].split(",")
+        return float(yes.strip(' "')), float(no.strip(' "'))
+    except (TypeError, ValueError, AttributeError):
+        pass  # Not the plain string form (None, already a list, odd spacing)
+
+    try:
+        prices = raw if isinstance(raw, list) else json.loads(raw)
+        yes_price = float(prices[0]) if prices else None
+        no_price = float(prices[1]) if len(prices) > 1 else None
+        return yes_price, no_price
+    except (TypeError, ValueError, KeyError, IndexError):
+        return None, None
+
 def parse_weather_event(event):
     """Parse a weather event to extract temperature ranges for each market."""
     city_info = event.get("_city_info")
@@ -647,7 +834,7 @@ def parse_weather_event(event):
         is_or_higher = "or higher" in question.lower() or "or above" in question.lower()
         
         # Match temperature value (handles negative)
-        temp_match = re.search(r'be\s+(-?\d+)°', question)
+        temp_match = _TEMP_RE.search(question)
         if temp_match:
             temp = int(temp_match.group(1))
             if is_or_below:
@@ -658,13 +845,7 @@ def parse_weather_event(event):
                 temp_range = (temp, temp)
         
         if temp_range:
-            try:
-                prices = json.loads(market.get("outcomePrices", "[]"))
-                yes_price = float(prices[0]) if prices else None
-                no_price = float(prices[1]) if len(prices) > 1 else None
-            except:
-                yes_price = None
-                no_price = None
+            yes_price, no_price = _parse_prices(market.get("outcomePrices", "[]"))
             
             markets_data.append({
                 "question": question,
@@ -689,25 +870,31 @@ def parse_weather_event(event):
         "is_us": city_info["is_us"],
         "local_source": city_info.get("local_source"),
         "date": city_info["date"],
+        "date_str": city_info.get("date_str") or city_info["date"].strftime("%Y-%m-%d"),
         "is_celsius": is_celsius,
-        "markets": sorted(markets_data, key=lambda x: x["temp_value"] if x["temp_value"] is not None else 999),
+        "markets": sorted(markets_data, key=itemgetter("temp_value")),
     }
 
-def calculate_probability(forecast_temp_c, temp_value, is_or_below, is_or_higher, confidence):
-    """Calculate probability that temperature matches a market bucket."""
-    # Forecast uncertainty in °C
-    base_std = 1.5  # Base ±1.5°C
-    adjusted_std = base_std * (1.5 - confidence)
-    
+def _adjusted_std(confidence):
+    """Forecast uncertainty in °C: base ±1.5°C, widened as confidence drops."""
+    base_std = 1.5
+    return base_std * (1.5 - confidence)
+
+def _bucket_probability(forecast_temp_c, temp_value, is_or_below, is_or_higher,
+                        adjusted_std, inv_adjusted_std):
+    """
+    calculate_probability core. adjusted_std and its reciprocal depend only
+    on confidence, so callers scoring many markets compute them once.
+    """
     if is_or_below:
         # Probability that actual <= temp_value
         diff = temp_value - forecast_temp_c
         if diff >= adjusted_std:
             prob = 0.90
         elif diff >= 0:
-            prob = 0.50 + (diff / adjusted_std) * 0.40
+            prob = 0.50 + (diff * inv_adjusted_std) * 0.40
         elif diff >= -adjusted_std:
-            prob = 0.10 + ((diff + adjusted_std) / adjusted_std) * 0.40
+            prob = 0.10 + ((diff + adjusted_std) * inv_adjusted_std) * 0.40
         else:
             prob = 0.05
             
@@ -717,9 +904,9 @@ def calculate_probability(forecast_temp_c, temp_value, is_or_below, is_or_higher
         if diff >= adjusted_std:
             prob = 0.90
         elif diff >= 0:
-            prob = 0.50 + (diff / adjusted_std) * 0.40
+            prob = 0.50 + (diff * inv_adjusted_std) * 0.40
         elif diff >= -adjusted_std:
-            prob = 0.10 + ((diff + adjusted_std) / adjusted_std) * 0.40
+            prob = 0.10 + ((diff + adjusted_std) * inv_adjusted_std) * 0.40
         else:
             prob = 0.05
             
@@ -737,8 +924,77 @@ def calculate_probability(forecast_temp_c, temp_value, is_or_below, is_or_higher
     
     return max(0.02, min(0.98, prob))
 
+def calculate_probability(forecast_temp_c, temp_value, is_or_below, is_or_higher, confidence):
+    """Calculate probability that temperature matches a market bucket."""
+    adjusted_std = _adjusted_std(confidence)
+    return _bucket_probability(forecast_temp_c, temp_value, is_or_below, is_or_higher,
+                               adjusted_std, 1.0 / adjusted_std)
+
+# Action codes from _edge_decision / score_markets_batch
+ACTION_SKIP, ACTION_BUY_YES, ACTION_BUY_NO = -1, 0, 1
+ACTION_NAMES = {ACTION_BUY_YES: "BUY YES", ACTION_BUY_NO: "BUY NO"}
+
+def _edge_decision(prob, market_yes_prob, confidence):
+    """
+    Trade decision for one market given our probability.
+
+    Returns (action_code, edge_pct, expected_value); action_code is
+    ACTION_SKIP when neither side clears the confidence-scaled margin.
+    """
+    if market_yes_prob <= 0:
+        return ACTION_SKIP, 0.0, 0.0
+
+    min_edge_mult = 1.5 - confidence
+
+    if prob > market_yes_prob + 0.03 * min_edge_mult:
+        edge = (prob - market_yes_prob) * 100
+        ev = prob / market_yes_prob
+        return ACTION_BUY_YES, edge, ev
+    if (1 - prob) > (1 - market_yes_prob) + 0.03 * min_edge_mult:
+        edge = ((1 - prob) - (1 - market_yes_prob)) * 100
+        ev = (1 - prob) / (1 - market_yes_prob) if market_yes_prob < 1 else 0.0
+        return ACTION_BUY_NO, edge, ev
+    return ACTION_SKIP, 0.0, 0.0
+
+score_markets_batch = None
+if HAS_NUMBA:
+    _adjusted_std_jit = numba.njit(cache=True)(_adjusted_std)
+    _bucket_probability_jit = numba.njit(cache=True)(_bucket_probability)
+    _edge_decision_jit = numba.njit(cache=True)(_edge_decision)
+
+    @numba.njit(cache=True)
+    def score_markets_batch(forecast_temp_c, temp_values, is_below, is_higher, yes_prices, confidence):
+        """
+        Probability, action, edge and EV for every market of an event in one
+        compiled pass. Returns (probs, actions, edges, evs) arrays.
+        """
+        adjusted_std = _adjusted_std_jit(confidence)
+        inv_adjusted_std = 1.0 / adjusted_std
+        n = temp_values.shape[0]
+        probs = np.empty(n)
+        actions = np.empty(n, dtype=np.int8)
+        edges = np.empty(n)
+        evs = np.empty(n)
+        for i in range(n):
+            prob = _bucket_probability_jit(
+                forecast_temp_c, temp_values[i], is_below[i], is_higher[i],
+                adjusted_std, inv_adjusted_std
+            )
+            probs[i] = prob
+            actions[i], edges[i], evs[i] = _edge_decision_jit(prob, yes_prices[i], confidence)
+        return probs, actions, edges, evs
+
 def analyze_weather_event(event_data):
     """Analyze a weather event against ensemble forecast."""
+    # Only markets with a usable YES price can produce an edge; if there are
+    # none, skip the forecast fetch entirely
+    markets = [
+        m for m in event_data["markets"]
+        if m["yes_price"] is not None and m["yes_price"] > 0 and m["temp_value"] is not None
+    ]
+    if not markets:
+        return []
+
     forecast = get_ensemble_forecast(
         event_data["coords"][0],
         event_data["coords"][1],
@@ -757,44 +1013,55 @@ def analyze_weather_event(event_data):
     opportunities = []
     
     is_celsius = event_data.get("is_celsius", True)
+    date_str = event_data["date_str"]
 
-    for market in event_data["markets"]:
-        if market["yes_price"] is None:
-            continue
-
-        temp_value = market["temp_value"]
-        if temp_value is None:
-            continue
+    # Convert market thresholds to Celsius if the market uses Fahrenheit
+    temps_c = [
+        m["temp_value"] if is_celsius else (m["temp_value"] - 32) * 5 / 9
+        for m in markets
+    ]
 
-        # Convert market threshold to Celsius if market uses Fahrenheit
-        temp_value_c = temp_value if is_celsius else (temp_value - 32) * 5 / 9
+    confidence = forecast["confidence"]
 
-        # Calculate probability
-        prob = calculate_probability(
+    # Probability, edge and EV per market, in one compiled pass when Numba is available
+    if score_markets_batch is not None:
+        probs, actions, edges, evs = score_markets_batch(
             forecast_temp_c,
-            temp_value_c,
-            market["is_or_below"],
-            market["is_or_higher"],
-            forecast["confidence"]
+            np.asarray(temps_c, dtype=np.float64),
+            np.asarray([bool(m["is_or_below"]) for m in markets]),
+            np.asarray([bool(m["is_or_higher"]) for m in markets]),
+            np.asarray([m["yes_price"] for m in markets], dtype=np.float64),
+            confidence,
         )
-        
-        market_yes_prob = market["yes_price"]
-        if market_yes_prob is None or market_yes_prob <= 0:
-            continue
-        
-        # Calculate edge
-        min_edge_mult = 1.5 - forecast["confidence"]
-        
-        if prob > market_yes_prob + 0.03 * min_edge_mult:
-            edge = (prob - market_yes_prob) * 100
-            action = "BUY YES"
-            ev = prob / market_yes_prob
-        elif (1 - prob) > (1 - market_yes_prob) + 0.03 * min_edge_mult:
-            edge = ((1 - prob) - (1 - market_yes_prob)) * 100
-            action = "BUY NO"
-            ev = (1 - prob) / (1 - market_yes_prob) if market_yes_prob < 1 else 0
-        else:
-            continue
+        accepted = np.flatnonzero(actions != ACTION_SKIP).tolist()
+        probs, actions, edges, evs = probs.tolist(), actions.tolist(), edges.tolist(), evs.tolist()
+    else:
+        adjusted_std = _adjusted_std(confidence)
+        inv_adjusted_std = 1.0 / adjusted_std
+        probs, actions, edges, evs = [], [], [], []
+        for m, temp_value_c in zip(markets, temps_c):
+            prob = _bucket_probability(
+                forecast_temp_c,
+                temp_value_c,
+                m["is_or_below"],
+                m["is_or_higher"],
+                adjusted_std,
+                inv_adjusted_std
+            )
+            action_code, edge, ev = _edge_decision(prob, m["yes_price"], confidence)
+            probs.append(prob)
+            actions.append(action_code)
+            edges.append(edge)
+            evs.append(ev)
+        accepted = [i for i, code in enumerate(actions) if code != ACTION_SKIP]
+
+    for i in accepted:
+        market = markets[i]
+        temp_value = market["temp_value"]
+        prob = probs[i]
+        action = ACTION_NAMES[actions[i]]
+        edge = edges[i]
+        ev = evs[i]
         
         confidence_adjusted_edge = edge * forecast["confidence"]
         
@@ -803,7 +1070,7 @@ def analyze_weather_event(event_data):
             "market_question": market["question"],
             "slug": market["slug"],
             "city": event_data["city"],
-            "date": event_data["date"].strftime("%Y-%m-%d"),
+            "date": date_str,
             "is_us": event_data["is_us"],
             "local_source": event_data.get("local_source"),
             "local_disagrees": forecast.get("local_disagrees", False),
@@ -896,6 +1163,22 @@ def test_apis():
 
     print("\nAPI test complete")
 
+async def ascan(events):
+    """
+    Parse and analyze events concurrently; returns all opportunities.
+
+    Each event's ensemble fetch runs in a worker thread, at most
+    EVENT_CONCURRENCY at a time, so the scan costs roughly the slowest
+    events' latency instead of the sum. Output order follows events.
+    """
+    parsed_events = [p for p in map(parse_weather_event, events) if p]
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=EVENT_CONCURRENCY, thread_name_prefix="event") as pool:
+        results = await asyncio.gather(*(
+            loop.run_in_executor(pool, analyze_weather_event, p) for p in parsed_events
+        ))
+    return [opp for opps in results for opp in opps]
+
 def main():
     parser = argparse.ArgumentParser(description="Weather arbitrage scanner for Polymarket (multi-source ensemble)")
     parser.add_argument("--min-edge", type=float, default=5.0, help="Minimum edge %% (default: 5.0)")
@@ -917,15 +1200,7 @@ def main():
     events = get_weather_events(days_ahead=args.days)
     print(f"   Found {len(events)} weather events\n")
     
-    all_opportunities = []
-    
-    for event in events:
-        parsed = parse_weather_event(event)
-        if not parsed:
-            continue
-        
-        opps = analyze_weather_event(parsed)
-        all_opportunities.extend(opps)
+    all_opportunities = asyncio.run(ascan(events))
     
     # Filter by confidence-adjusted edge
     filtered = [o for o in all_opportunities if o["confidence_adjusted_edge"] >= args.min_edge]
@@ -943,29 +1218,32 @@ def main():
             print("   No weather arbitrage opportunities found at current threshold.")
             print("   Try --min-edge 3 or check back when forecasts diverge from market odds.")
         else:
+            # Build the report in memory and write it once
+            out = io.StringIO()
             for opp in filtered[:15]:
                 conf_emoji = "🟢" if opp['forecast_confidence'] > 0.8 else "🟡" if opp['forecast_confidence'] > 0.6 else "🔴"
                 
-                print(f"{'='*65}")
-                print(f"🎯 {opp['action']} — {opp['edge_pct']:.1f}% edge ({opp['confidence_adjusted_edge']:.1f}% adj)")
-                print(f"   {opp['market_question'][:58]}...")
-                print(f"   📍 {opp['city']} {'🇺🇸' if opp['is_us'] else '🌍'} on {opp['date']}")
-                print(f"   🌡️  Forecast: {opp['forecast_temp']} (from {len(opp['forecast_sources'])} sources)")
-                print(f"   {conf_emoji} Confidence: {opp['forecast_confidence']*100:.0f}%", end="")
+                print(f"{'='*65}", file=out)
+                print(f"🎯 {opp['action']} — {opp['edge_pct']:.1f}% edge ({opp['confidence_adjusted_edge']:.1f}% adj)", file=out)
+                print(f"   {opp['market_question'][:58]}...", file=out)
+                print(f"   📍 {opp['city']} {'🇺🇸' if opp['is_us'] else '🌍'} on {opp['date']}", file=out)
+                print(f"   🌡️  Forecast: {opp['forecast_temp']} (from {len(opp['forecast_sources'])} sources)", file=out)
+                print(f"   {conf_emoji} Confidence: {opp['forecast_confidence']*100:.0f}%", end="", file=out)
                 if opp['forecast_spread']:
-                    print(f" (spread: ±{opp['forecast_spread']:.1f}°C)")
+                    print(f" (spread: ±{opp['forecast_spread']:.1f}°C)", file=out)
                 else:
-                    print()
-                print(f"   💰 Market: YES {opp['market_yes_price']*100:.0f}¢ / NO {opp['market_no_price']*100:.0f}¢")
-                print(f"   📊 Our prob: {opp['forecast_prob']*100:.0f}% YES")
-                print(f"   💵 EV: {opp['expected_value']:.2f}x | Liquidity: ${opp['liquidity']:,.0f}")
-                print(f"   🔗 {opp['url']}")
+                    print(file=out)
+                print(f"   💰 Market: YES {opp['market_yes_price']*100:.0f}¢ / NO {opp['market_no_price']*100:.0f}¢", file=out)
+                print(f"   📊 Our prob: {opp['forecast_prob']*100:.0f}% YES", file=out)
+                print(f"   💵 EV: {opp['expected_value']:.2f}x | Liquidity: ${opp['liquidity']:,.0f}", file=out)
+                print(f"   🔗 {opp['url']}", file=out)
                 
                 if args.verbose and opp['individual_forecasts']:
-                    print(f"   📋 Individual forecasts:")
+                    print(f"   📋 Individual forecasts:", file=out)
                     for f in opp['individual_forecasts']:
-                        print(f"      - {f['source']}: {f['high_c']:.1f}°C high")
-                print()
+                        print(f"      - {f['source']}: {f['high_c']:.1f}°C high", file=out)
+                print(file=out)
+            sys.stdout.write(out.getvalue())
         
         print("\n📝 Notes:")
         print("   - Confidence-adjusted edge accounts for forecast uncertainty")
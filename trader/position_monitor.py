@@ -17,31 +17,58 @@ sys.path.insert(0, str(SCRIPT_DIR))
 from polymarket_api import get_client, get_open_orders
 from weather_arb import get_weather_events, parse_weather_event, analyze_weather_event, get_ensemble_forecast
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 JOURNAL_DIR = Path(__file__).parent / "polymarket-trader" / "journal"
 POSITIONS_FILE = Path(__file__).parent / "polymarket-trader" / "cache" / "active_positions.json"
 
+# Bytes of active_positions.json as last read or written by this process
+_positions_on_disk = None
+
 def load_active_positions():
     """Load active positions from cache."""
+    global _positions_on_disk
     if not POSITIONS_FILE.exists():
         return []
 
-    with open(POSITIONS_FILE) as f:
-        return json.load(f)
+    with open(POSITIONS_FILE, 'rb') as f:
+        _positions_on_disk = f.read()
+    return json.loads(_positions_on_disk)
+
+def _dump_positions(positions):
+    if HAS_ORJSON:
+        return orjson.dumps(positions, option=orjson.OPT_INDENT_2)
+    return json.dumps(positions, indent=2).encode()
 
 def save_active_positions(positions):
-    """Save active positions to cache."""
+    """Save active positions to cache (atomically, and only if changed)."""
+    global _positions_on_disk
+    payload = _dump_positions(positions)
+    if payload == _positions_on_disk:
+        return
+
     POSITIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(POSITIONS_FILE, 'w') as f:
-        json.dump(positions, indent=2, fp=f)
 
-def get_todays_log():
+    # Write atomically (write to temp, then rename)
+    temp_file = POSITIONS_FILE.with_suffix('.tmp')
+    with open(temp_file, 'wb') as f:
+        f.write(payload)
+
+    temp_file.replace(POSITIONS_FILE)
+    _positions_on_disk = payload
+
+def get_todays_log(now=None):
     """Get today's log file path."""
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = (now or datetime.now()).strftime("%Y-%m-%d")
     return JOURNAL_DIR / f"{today}.md"
 
 def log_monitor_cycle(results, timestamp):
     """Log monitoring results to daily journal."""
-    log_file = get_todays_log()
+    log_file = get_todays_log(timestamp)
 
     with open(log_file, 'a') as f:
         f.write(f"\n## POSITION MONITOR - {timestamp.strftime('%H:%M:%S')}\n\n")
@@ -54,21 +81,47 @@ def log_monitor_cycle(results, timestamp):
         f.write("| Market | Entry Price | Current Price | Original Edge | Current Edge | Forecast Change | Action |\n")
         f.write("|--------|-------------|---------------|---------------|--------------|-----------------|--------|\n")
 
-        for r in results:
-            f.write(f"| {r['market']} | {r['entry_price']}¢ | {r['current_price']}¢ | "
-                   f"{r['original_edge']:.1f}% | {r['current_edge']:.1f}% | "
-                   f"{r['forecast_change']} | {r['action']} |\n")
+        f.writelines(
+            f"| {r['market']} | {r['entry_price']}¢ | {r['current_price']}¢ | "
+            f"{r['original_edge']:.1f}% | {r['current_edge']:.1f}% | "
+            f"{r['forecast_change']} | {r['action']} |\n"
+            for r in results
+        )
 
         f.write("\n### Forecast Details\n\n")
 
-        for r in results:
-            if r.get('forecast_details'):
-                f.write(f"**{r['market']}**: {r['forecast_details']}\n\n")
+        f.writelines(
+            f"**{r['market']}**: {r['forecast_details']}\n\n"
+            for r in results if r.get('forecast_details')
+        )
+
+def build_event_index(events):
+    """
+    Parse each event once and index it by (city, date).
 
-def monitor_position(position, events):
+    Returns {(city_lower, 'YYYY-MM-DD'): [entry, ...]} where entry is
+    {'parsed': ..., 'questions': set, 'opps': None}. 'opps' is filled in by
+    monitor_position the first time a position needs that event analyzed.
+    """
+    index = {}
+    for event in events:
+        parsed = parse_weather_event(event)
+        if not parsed:
+            continue
+        key = (parsed['city'].lower(), parsed['date_str'])
+        index.setdefault(key, []).append({
+            'parsed': parsed,
+            'questions': {m.get('question') for m in parsed.get('markets', [])},
+            'opps': None,
+        })
+    return index
+
+def monitor_position(position, event_index):
     """
     Monitor a single position against fresh forecast data.
 
+    event_index comes from build_event_index() for this cycle.
+
     Returns dict with:
     - action: HOLD, EXIT, STRENGTHEN
     - current_edge: recalculated edge
@@ -82,24 +135,13 @@ def monitor_position(position, events):
     side = position['side']
 
     # Find the market
-    market_data = None
-    for event in events:
-        parsed = parse_weather_event(event)
-        if not parsed or parsed['city'].lower() != city.lower():
-            continue
-        if parsed['date'].strftime('%Y-%m-%d') != date_str:
-            continue
-
-        # Find matching question
-        for market in parsed.get('markets', []):
-            if market.get('question') == question:
-                market_data = market
-                break
-
-        if market_data:
+    match = None
+    for entry in event_index.get((city.lower(), date_str), ()):
+        if question in entry['questions']:
+            match = entry
             break
 
-    if not market_data:
+    if not match:
         return {
             'action': 'HOLD',
             'current_edge': original_edge,
@@ -108,9 +150,10 @@ def monitor_position(position, events):
             'forecast_details': None
         }
 
-    # Get fresh forecast
-    parsed = parse_weather_event(event)
-    opps = analyze_weather_event(parsed)
+    # Get fresh forecast (once per event, shared by positions in it)
+    if match['opps'] is None:
+        match['opps'] = analyze_weather_event(match['parsed'])
+    opps = match['opps']
 
     # Find the specific opportunity
     current_opp = None
@@ -206,20 +249,22 @@ def exit_position(client, position, reason):
 
 def monitor_all_positions():
     """Run monitoring cycle for all active positions."""
+    # One timestamp for the whole cycle: resolution checks, event dates, log
+    now = datetime.now()
+
     print(f"🔍 POSITION MONITOR")
-    print(f"   Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    print(f"   Time: {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
     positions = load_active_positions()
 
     if not positions:
         print("   No active positions to monitor.\n")
-        log_monitor_cycle([], datetime.now())
+        log_monitor_cycle([], now)
         return
 
     print(f"   Monitoring {len(positions)} active position(s)...\n")
 
     # Filter positions that are within 2 hours of resolution
-    now = datetime.now()
     positions_to_check = []
 
     for pos in positions:
@@ -236,7 +281,8 @@ def monitor_all_positions():
         return
 
     # Fetch current market data
-    events = get_weather_events(days_ahead=3)
+    events = get_weather_events(days_ahead=3, now=now)
+    event_index = build_event_index(events)
 
     results = []
     actions_taken = []
@@ -245,7 +291,7 @@ def monitor_all_positions():
     for pos in positions_to_check:
         print(f"   Checking {pos['market']}...")
 
-        monitor_result = monitor_position(pos, events)
+        monitor_result = monitor_position(pos, event_index)
 
         result_row = {
             'market': pos['market'],
@@ -297,9 +343,9 @@ def monitor_all_positions():
     save_active_positions(positions)
 
     # Log results
-    log_monitor_cycle(results, datetime.now())
+    log_monitor_cycle(results, now)
 
-    print(f"   📝 Monitor cycle logged to {get_todays_log()}")
+    print(f"   📝 Monitor cycle logged to {get_todays_log(now)}")
 
     if actions_taken:
         print(f"\n   Actions taken:")
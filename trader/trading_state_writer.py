@@ -7,12 +7,47 @@ DO NOT include secrets (full wallet addresses, private keys, API keys).
 """
 
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Trading state file location (single source of truth)
 TRADING_STATE_FILE = Path(__file__).parent / "polymarket-trader" / "trading_state.json"
 
+# Shared by every writer of the trader state files (this module, order_monitor,
+# autonomous_trader_v2) so they agree on format and durability.
+def dump_state_json(obj, pretty: bool = False) -> bytes:
+    """
+    Serialize state as UTF-8 JSON; non-JSON values (e.g. datetimes) go through str().
+    Compact by default — these files are rewritten several times per run and only
+    read by other scripts. pretty=True indents for human inspection
+    (autonomous_trader_v2.py --pretty).
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, default=str).encode()
+    return json.dumps(obj, separators=(',', ':'), default=str).encode()
+
+def write_state_file(path: Path, obj, pretty: bool = False):
+    """Serialize obj once and swap it into place (tmp + fsync + rename), so readers never see a partial file."""
+    data = dump_state_json(obj, pretty)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
 def mask_wallet(wallet_address):
     """Mask wallet address for security (show first 6 and last 4 chars)."""
     if not wallet_address or len(wallet_address) < 10:
@@ -25,15 +60,21 @@ def load_recent_activity():
         return []
 
     try:
-        with open(TRADING_STATE_FILE, 'r') as f:
-            state = json.load(f)
-            return state.get('recent_activity', [])
+        with open(TRADING_STATE_FILE, 'rb') as f:
+            data = f.read()
+        state = orjson.loads(data) if HAS_ORJSON else json.loads(data)
+        return state.get('recent_activity', [])
     except:
         return []
 
-def add_activity(activity_type, market, details):
-    """Add an activity event to recent activity list."""
-    activity = load_recent_activity()
+def add_activity(activity_type, market, details, activity=None):
+    """
+    Add an activity event to recent activity list.
+    Pass the list returned by a previous call as activity to record several
+    events before writing the state file (default: reload it from disk).
+    """
+    if activity is None:
+        activity = load_recent_activity()
     activity.append({
         "timestamp": datetime.now().isoformat(),
         "type": activity_type,
@@ -108,12 +149,7 @@ def write_trading_state(balance_data, open_orders, active_positions, recent_acti
         }
     }
 
-    # Write atomically (write to temp, then rename)
-    temp_file = TRADING_STATE_FILE.with_suffix('.tmp')
-    with open(temp_file, 'w') as f:
-        json.dump(state, f, indent=2)
-
-    temp_file.replace(TRADING_STATE_FILE)
+    write_state_file(TRADING_STATE_FILE, state)
 
 def log_balance_check(balance_data):
     """Log a balance check event."""
@@ -133,21 +169,23 @@ def log_order_placed(order_data):
     )
     return activity
 
-def log_order_filled(order_data, fill_details):
+def log_order_filled(order_data, fill_details, activity=None):
     """Log an order fill event."""
     activity = add_activity(
         "ORDER_FILLED",
         order_data.get('market', 'Unknown'),
-        f"Filled at {fill_details.get('price', 0)*100:.0f}¢, {fill_details.get('shares', 0):.2f} shares"
+        f"Filled at {fill_details.get('price', 0)*100:.0f}¢, {fill_details.get('shares', 0):.2f} shares",
+        activity
     )
     return activity
 
-def log_order_cancelled(order_data, reason):
+def log_order_cancelled(order_data, reason, activity=None):
     """Log an order cancellation event."""
     activity = add_activity(
         "ORDER_CANCELLED",
         order_data.get('market', 'Unknown'),
-        f"Reason: {reason}"
+        f"Reason: {reason}",
+        activity
     )
     return activity
 
@@ -133,7 +133,7 @@ def scan_weather_markets(min_edge=5.0, days_ahead=3):
         if not parsed:
             continue
 
-        print(f"   Analyzing {parsed['city']} on {parsed['date'].strftime('%Y-%m-%d')}...")
+        print(f"   Analyzing {parsed['city']} on {parsed['date_str']}...")
         opps = analyze_weather_event(parsed)
         all_opportunities.extend(opps)
 
@@ -196,7 +196,7 @@ def main():
             if forecast_checks:
                 # Save state
                 state_data = {
-                    'positions': [vars(pos) for pos in tracker.get_active_positions()],
+                    'positions': [pos.as_dict() for pos in tracker.get_active_positions()],
                     'exits': [vars(exit) for exit in tracker.exits]
                 }
                 forecast_monitor.save_state(state_data)